@@ -1,18 +1,20 @@
+import hashlib
 import json
-import anthropic
-from config.settings import _get_secret, CLAUDE_MODEL
+import re
+from functools import lru_cache
+from config.settings import CLAUDE_MODEL
+from benchmark.shared_clients import get_anthropic_client
 from config.brands import BRAND_DEFINITIONS
 
+try:
+    import orjson
+    json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
 
-VALID_BRANDS = {"on24", "goldcast", "zoom", "other"}
-
+CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.DOTALL)
 
-class ResponseParser:
-    def __init__(self):
-        self.client = anthropic.Anthropic(api_key=_get_secret("ANTHROPIC_API_KEY"))
-
-    def parse_response(self, raw_response_text: str) -> dict:
-        system_prompt = """Extract brand mentions from an LLM response about webinar platforms.
+PARSE_SYSTEM_PROMPT = """Extract brand mentions from an LLM response about webinar platforms.
 
 Return ONLY a JSON object (no markdown, no explanation) with this exact structure:
 {
@@ -38,22 +40,62 @@ RULES:
 - overall_winner = brand most favorably positioned, or "none"
 - brands_not_mentioned = list of on24/goldcast/zoom that are NOT mentioned"""
 
+# Batched parsing: several responses share one Claude call, each answered as one element of a JSON array
+PARSE_BATCH_INSTRUCTIONS = """
+
+You will receive several LLM responses, each wrapped in <response id="N">...</response>.
+Return ONLY a JSON array (no markdown, no explanation) with one object per response, in any order.
+Each object has the structure above plus "id": N, the id of the response it describes."""
+PARSE_MAX_TOKENS = 2048  # per response, so a batch of n gets n times this
+
+VALID_BRANDS = {"on24", "goldcast", "zoom", "other"}
+
+BRAND_ALIAS_LOWER = {
+    alias.lower(): key
+    for key, defn in BRAND_DEFINITIONS.items()
+    for alias in [key, *defn["aliases"]]
+}
+BRAND_DISPLAY_LOWER = {defn["display_name"].lower(): key for key, defn in BRAND_DEFINITIONS.items()}
+# One alternation over all display names; longest first so overlapping names prefer the fuller match
+BRAND_DISPLAY_RE = re.compile(
+    "|".join(re.escape(name) for name in sorted(BRAND_DISPLAY_LOWER, key=len, reverse=True))
+)
+
+
+class ResponseParser:
+    def __init__(self, db=None):
+        self.client = get_anthropic_client()
+        self.db = db
+
+    @staticmethod
+    def _cache_key(raw_response_text):
+        return hashlib.sha256(f"{CLAUDE_MODEL}\n{raw_response_text}".encode()).hexdigest()
+
+    def parse_response(self, raw_response_text: str) -> dict:
+        # Identical responses (reruns, retries, repeated answers) skip the Claude call
+        cache_key = self._cache_key(raw_response_text)
+        if self.db is not None:
+            cached = self.db.get_cached_parse(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.messages.create(
                 model=CLAUDE_MODEL,
-                max_tokens=2048,
-                system=system_prompt,
+                max_tokens=PARSE_MAX_TOKENS,
+                system=PARSE_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": raw_response_text}],
             )
 
             text = response.content[0].text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
+            fence = CODE_FENCE_RE.search(text)
+            if fence:
+                text = fence.group(1)
 
-            parsed = json.loads(text)
-            return self._normalize(parsed)
+            parsed = self._normalize(json_loads(text))
+            if self.db is not None:
+                self.db.store_cached_parse(cache_key, parsed)
+            return parsed
 
         except (json.JSONDecodeError, IndexError, KeyError, Exception) as e:
             return {
@@ -64,6 +106,49 @@ RULES:
                 "parse_error": str(e),
             }
 
+    def parse_responses(self, raw_response_texts: list) -> list:
+        """Parse several responses with one Claude call; rows it fails to return are parsed one by one."""
+        results = [None] * len(raw_response_texts)
+        pending = {}  # row id -> cache key
+        for i, text in enumerate(raw_response_texts):
+            key = self._cache_key(text)
+            cached = self.db.get_cached_parse(key) if self.db is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[i] = key
+
+        if len(pending) > 1:
+            try:
+                response = self.client.messages.create(
+                    model=CLAUDE_MODEL,
+                    max_tokens=PARSE_MAX_TOKENS * len(pending),
+                    system=PARSE_SYSTEM_PROMPT + PARSE_BATCH_INSTRUCTIONS,
+                    messages=[{"role": "user", "content": "\n\n".join(
+                        f'<response id="{i}">\n{raw_response_texts[i]}\n</response>' for i in pending
+                    )}],
+                )
+                text = response.content[0].text.strip()
+                fence = CODE_FENCE_RE.search(text)
+                if fence:
+                    text = fence.group(1)
+                for row in json_loads(text):
+                    try:
+                        i = int(row["id"])
+                    except (TypeError, KeyError, ValueError):
+                        continue
+                    if i in pending and results[i] is None:
+                        results[i] = self._normalize(row)
+                        if self.db is not None:
+                            self.db.store_cached_parse(pending[i], results[i])
+            except Exception:
+                pass  # every row of the batch falls back to its own call below
+
+        for i in pending:
+            if results[i] is None:
+                results[i] = self.parse_response(raw_response_texts[i])
+        return results
+
     def _normalize(self, parsed: dict) -> dict:
         mentions_raw = parsed.get("mentions") or parsed.get("brands_mentioned", [])
         normalized = []
@@ -90,11 +175,10 @@ RULES:
         }
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _resolve_brand(brand_str: str) -> str:
         brand_str = brand_str.lower().strip()
-        for key, defn in BRAND_DEFINITIONS.items():
-            if brand_str == key or brand_str in [a.lower() for a in defn["aliases"]]:
-                return key
-            if defn["display_name"].lower() in brand_str:
-                return key
-        return "other"
+        if brand_str in BRAND_ALIAS_LOWER:
+            return BRAND_ALIAS_LOWER[brand_str]
+        match = BRAND_DISPLAY_RE.search(brand_str)
+        return BRAND_DISPLAY_LOWER[match.group(0)] if match else "other"
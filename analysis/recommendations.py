@@ -1,16 +1,30 @@
+import io
 import json
-import anthropic
+from functools import lru_cache
 from itertools import groupby
 from operator import itemgetter
-from config.settings import _get_secret, CLAUDE_MODEL_RECOMMENDATIONS
+from config.settings import CLAUDE_MODEL_RECOMMENDATIONS
+from benchmark.shared_clients import get_anthropic_client
+from analysis.parser import CODE_FENCE_RE, json_loads
+from db.database import DatabaseManager
 
 
 class RecommendationEngine:
     def __init__(self, db):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=_get_secret("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic_client()
 
     def generate_recommendations(self, run_id=None) -> dict:
+        """Claude's recommendations for a run; reused from recommendations_cache while the run is unchanged."""
+        if run_id is None:
+            run_id = self.db.get_latest_run_id()
+        run = self.db.get_run(run_id) if run_id else None
+        completed_at = run["completed_at"] if run else None
+        if run:
+            cached = self.db.get_cached_recommendations(run_id, completed_at, CLAUDE_MODEL_RECOMMENDATIONS)
+            if cached is not None:
+                return cached
+
         data_summary = self._build_data_summary(run_id)
 
         system_prompt = """You are a senior GEO (Generative Engine Optimization) strategist for B2B marketing technology.
@@ -44,12 +58,11 @@ Return a JSON object with this exact structure:
             )
 
             text = response.content[0].text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
+            fence = CODE_FENCE_RE.search(text)
+            if fence:
+                text = fence.group(1)
 
-            return json.loads(text)
+            recs = json_loads(text)
 
         except (json.JSONDecodeError, Exception) as e:
             return {
@@ -64,33 +77,47 @@ Return a JSON object with this exact structure:
                 },
             }
 
+        # Error placeholders above are returned uncached so the next call retries
+        if run:
+            self.db.store_cached_recommendations(run_id, completed_at, CLAUDE_MODEL_RECOMMENDATIONS, recs)
+        return recs
+
     def _build_data_summary(self, run_id=None) -> str:
         if run_id is None:
             run_id = self.db.get_latest_run_id()
         if not run_id:
             return "No benchmark data available yet."
 
-        metrics = self.db.get_daily_metrics_for_run(run_id)
-        lines = ["=== GEO BENCHMARK DATA SUMMARY ===\n"]
-
-        sorted_metrics = sorted(metrics, key=itemgetter("query_id"))
-        for query_id, group in groupby(sorted_metrics, key=itemgetter("query_id")):
-            rows = list(group)
-            query_text = self.db.get_query_text(query_id)
-            lines.append(f"\nQuery: \"{query_text}\"")
-            lines.append(f"Category: {rows[0]['query_category']}")
-
-            for row in rows:
-                status = "MENTIONED" if row["is_mentioned"] else "NOT MENTIONED"
-                primary = " [PRIMARY]" if row["is_primary_recommendation"] else ""
-                winner = " [WINNER]" if row["is_winner"] else ""
-                pos = f"Pos#{row['first_mention_position']}" if row["first_mention_position"] else "N/A"
-                sent = f"Sent:{row['avg_sentiment_score']:.2f}" if row["avg_sentiment_score"] is not None else ""
-                cites = f"Cites:{row['citation_count']}" if row["citation_count"] else ""
-
-                lines.append(
-                    f"  [{row['llm_engine']}] {row['brand'].upper()}: "
-                    f"{status} | {pos} | {sent} | {cites}{primary}{winner}"
-                )
-
-        return "\n".join(lines)
+        # completed_at changes whenever metrics are (re)computed, including from another process
+        run = self.db.get_run(run_id)
+        return _cached_data_summary(self.db.db_path, run_id, run["completed_at"] if run else None)
+
+
+@lru_cache(maxsize=16)
+def _cached_data_summary(db_path, run_id, completed_at) -> str:
+    db = DatabaseManager(db_path)
+    metrics = db.get_daily_metrics_for_run(run_id)
+    query_index = db.load_query_index()
+    buf = io.StringIO()
+    buf.write("=== GEO BENCHMARK DATA SUMMARY ===\n")
+
+    sorted_metrics = sorted(metrics, key=itemgetter("query_id"))
+    for query_id, group in groupby(sorted_metrics, key=itemgetter("query_id")):
+        rows = list(group)
+        query_text = query_index[query_id]["text"] if query_id in query_index else None
+        buf.write(f"\n\nQuery: \"{query_text}\"\nCategory: {rows[0]['query_category']}")
+
+        for row in rows:
+            status = "MENTIONED" if row["is_mentioned"] else "NOT MENTIONED"
+            primary = " [PRIMARY]" if row["is_primary_recommendation"] else ""
+            winner = " [WINNER]" if row["is_winner"] else ""
+            pos = f"Pos#{row['first_mention_position']}" if row["first_mention_position"] else "N/A"
+            sent = f"Sent:{row['avg_sentiment_score']:.2f}" if row["avg_sentiment_score"] is not None else ""
+            cites = f"Cites:{row['citation_count']}" if row["citation_count"] else ""
+
+            buf.write(
+                f"\n  [{row['llm_engine']}] {row['brand'].upper()}: "
+                f"{status} | {pos} | {sent} | {cites}{primary}{winner}"
+            )
+
+    return buf.getvalue()
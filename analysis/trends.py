@@ -55,3 +55,20 @@ class TrendAnalyzer:
                GROUP BY run_date, brand ORDER BY run_date""",
             (engine, f"-{days} days"),
         )
+
+    def get_all_trends(self, engine="grok_web_search", days=30, frame=False):
+        """All trend aggregates in one scan; rows with no positions/sentiment carry None for those columns."""
+        return (self.db.read_df if frame else self.db.query)(
+            """SELECT run_date AS date, brand,
+                      ROUND(AVG(is_mentioned) * 100, 1) AS sov,
+                      ROUND(AVG(first_mention_position), 2) AS avg_position,
+                      ROUND(AVG(avg_sentiment_score), 3) AS sentiment,
+                      ROUND(AVG(is_winner) * 100, 1) AS win_rate,
+                      SUM(citation_count) AS total_citations,
+                      SUM(www_citation_count) AS www_citations,
+                      SUM(event_citation_count) AS event_citations
+               FROM daily_metrics
+               WHERE llm_engine = ? AND run_date >= date('now', ?)
+               GROUP BY run_date, brand ORDER BY run_date""",
+            (engine, f"-{days} days"),
+        )
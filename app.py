@@ -30,13 +30,20 @@ st.sidebar.selectbox(
 )
 
 # Quick stats from latest run
-from db.database import DatabaseManager
+from db._singleton import get_db
+from config.settings import _get_secret
 
-db = DatabaseManager()
-latest = db.get_latest_run_id()
+
+@st.cache_data(ttl=60)
+def load_latest_sov(engine):
+    db = get_db()
+    latest = db.get_latest_run_id()
+    return latest, db.get_latest_sov(engine) if latest else []
+
+
+latest, sov_data = load_latest_sov(st.session_state.get("selected_engine", "grok_web_search"))
 
 if latest:
-    sov_data = db.get_latest_sov(st.session_state.get("selected_engine", "grok_web_search"))
     if sov_data:
         cols = st.columns(len(sov_data))
         for i, row in enumerate(sov_data):
@@ -58,7 +65,6 @@ else:
 # API key status check
 with st.expander("API Key Status"):
     import os
-    from config.settings import _get_secret
 
     # Check st.secrets directly
     try:
@@ -73,7 +79,7 @@ with st.expander("API Key Status"):
 
     # Check each key
     for key in ["ANTHROPIC_API_KEY", "XAI_API_KEY", "OPENAI_API_KEY"]:
-        val = _get_secret(key)
+        val = _get_secret(key)  # uncached: this view diagnoses the secrets as they are now
         if val:
             st.success(f"{key}: Configured ({val[:12]}... | length={len(val)})")
         else:
@@ -1,20 +1,45 @@
+import logging
 import time
 import anthropic
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from config.settings import _get_secret, CLAUDE_MODEL, CLAUDE_DELAY_SECONDS
+from config.settings import CLAUDE_MODEL, BATCH_MAX_WAIT_MINUTES, BATCH_POLL_SECONDS
+from benchmark.shared_clients import get_anthropic_client
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "You are a knowledgeable B2B marketing technology analyst. "
+    "When answering questions about webinar platforms and virtual event solutions, "
+    "provide comprehensive, balanced comparisons based on your knowledge. "
+    "Focus on enterprise B2B use cases. When discussing Zoom, focus ONLY on "
+    "Zoom Webinars and Zoom Events (not Zoom Meetings or video conferencing)."
+)
 
 
 class ClaudeParametricClient:
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=_get_secret("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic_client()
         self.model = CLAUDE_MODEL
-        self._last_call = 0
 
-    def _wait(self):
-        elapsed = time.time() - self._last_call
-        if elapsed < CLAUDE_DELAY_SECONDS:
-            time.sleep(CLAUDE_DELAY_SECONDS - elapsed)
-        self._last_call = time.time()
+    def _params(self, query_text):
+        return {
+            "model": self.model,
+            "max_tokens": 2048,
+            "system": SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": query_text}],
+        }
+
+    @staticmethod
+    def _result(message):
+        return {
+            "raw_response": message.content[0].text,
+            "model": message.model,
+            "usage": {
+                "input_tokens": message.usage.input_tokens,
+                "output_tokens": message.usage.output_tokens,
+            },
+            "citations": [],
+        }
 
     @retry(
         stop=stop_after_attempt(3),
@@ -22,27 +47,29 @@ class ClaudeParametricClient:
         retry=retry_if_exception_type((anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError)),
     )
     def query(self, query_text: str) -> dict:
-        self._wait()
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2048,
-            system=(
-                "You are a knowledgeable B2B marketing technology analyst. "
-                "When answering questions about webinar platforms and virtual event solutions, "
-                "provide comprehensive, balanced comparisons based on your knowledge. "
-                "Focus on enterprise B2B use cases. When discussing Zoom, focus ONLY on "
-                "Zoom Webinars and Zoom Events (not Zoom Meetings or video conferencing)."
-            ),
-            messages=[{"role": "user", "content": query_text}],
-        )
+        return self._result(self.client.messages.create(**self._params(query_text)))
 
-        return {
-            "raw_response": response.content[0].text,
-            "model": response.model,
-            "usage": {
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-            },
-            "citations": [],
-        }
+    def query_batch(self, query_texts) -> dict:
+        """Answer queries through the Message Batches API (half price, outside the RPM limit).
+
+        Returns {query_text: result} for the requests that succeeded. A batch still running after
+        BATCH_MAX_WAIT_MINUTES is cancelled and returns {}, leaving every query to query().
+        """
+        query_texts = list(query_texts)
+        batch = self.client.messages.batches.create(requests=[
+            {"custom_id": str(i), "params": self._params(text)} for i, text in enumerate(query_texts)
+        ])
+        deadline = time.monotonic() + BATCH_MAX_WAIT_MINUTES * 60
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                logger.warning(f"Claude batch {batch.id} still running after {BATCH_MAX_WAIT_MINUTES} min; cancelling")
+                self.client.messages.batches.cancel(batch.id)
+                return {}
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[query_texts[int(entry.custom_id)]] = self._result(entry.result.message)
+        return results
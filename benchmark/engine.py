@@ -1,116 +1,232 @@
 import datetime
 import logging
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from db.database import DatabaseManager
-from benchmark.grok_client import GrokWebSearchClient
-from benchmark.claude_client import ClaudeParametricClient
-from benchmark.openai_client import OpenAISearchClient
+from benchmark.llm_cache import LLMCache
 from analysis.parser import ResponseParser
 from analysis.metrics import MetricsCalculator
 from config.queries import QUERY_LIBRARY
+from config.settings import GROK_RPM, OPENAI_RPM, CLAUDE_RPM, ENGINES_ENABLED, BATCH_ENGINES_SCHEDULED
 
 logger = logging.getLogger(__name__)
 
-ENGINES = ["grok_web_search", "chatgpt_web_search", "claude_parametric"]
+ALL_ENGINES = ["grok_web_search", "chatgpt_web_search", "claude_parametric"]
+ENGINES = [eng for eng in ALL_ENGINES if eng in ENGINES_ENABLED]
 
-# Per-engine rate limiting (seconds between requests per engine)
-ENGINE_DELAYS = {
-    "grok_web_search": 2.5,
-    "chatgpt_web_search": 1.5,
-    "claude_parametric": 1.5,
+# Per-engine request budget: at most N calls in any rolling RATE_LIMIT_PERIOD window
+ENGINE_RATE_LIMITS = {
+    "grok_web_search": GROK_RPM,
+    "chatgpt_web_search": OPENAI_RPM,
+    "claude_parametric": CLAUDE_RPM,
+}
+RATE_LIMIT_PERIOD = 60.0
+
+# Per-engine cap on in-flight API calls; each engine gets a worker pool of this size
+ENGINE_MAX_CONCURRENCY = {
+    "grok_web_search": 3,
+    "chatgpt_web_search": 3,
+    "claude_parametric": 3,
+}
+
+ENGINE_LABELS = {"grok_web_search": "Grok", "chatgpt_web_search": "ChatGPT", "claude_parametric": "Claude"}
+
+# Threads parsing answers while the API workers keep querying; each parser call extracts mentions
+# for up to PARSE_BATCH_SIZE answers. Buffered answers exist only in memory (they are stored with
+# their mentions), so a partial batch is sent once its oldest answer has waited PARSE_FLUSH_SECONDS
+PARSE_WORKERS = 3
+PARSE_BATCH_SIZE = 10
+PARSE_FLUSH_SECONDS = 2.0
+
+# The writer thread commits queued responses with their mention/citation rows once a batch reaches
+# WRITE_BATCH_ROWS or WRITE_FLUSH_SECONDS has passed since its first item; WRITE_QUEUE_SIZE bounds the backlog
+WRITE_BATCH_ROWS = 1000
+WRITE_FLUSH_SECONDS = 0.1
+WRITE_QUEUE_SIZE = 64
+
+
+# Engine clients are process-wide so repeated BenchmarkEngine() constructions (each run started
+# from the dashboard) reuse their HTTP pools instead of rebuilding them. SDKs are imported here,
+# on first construction, so importing this module (and disabled engines) stays cheap.
+@lru_cache(maxsize=1)
+def _grok_client():
+    from benchmark.grok_client import GrokWebSearchClient
+    return GrokWebSearchClient()
+
+
+@lru_cache(maxsize=1)
+def _claude_client():
+    from benchmark.claude_client import ClaudeParametricClient
+    return ClaudeParametricClient()
+
+
+@lru_cache(maxsize=1)
+def _openai_client():
+    from benchmark.openai_client import OpenAISearchClient
+    return OpenAISearchClient()
+
+
+CLIENT_FACTORIES = {
+    "grok_web_search": _grok_client,
+    "chatgpt_web_search": _openai_client,
+    "claude_parametric": _claude_client,
 }
 
 
 class _RateLimiter:
-    """Thread-safe per-engine rate limiter."""
+    """Thread-safe per-engine sliding-window limiter; admits bursts while the window has room."""
     def __init__(self):
-        self._locks = {eng: threading.Lock() for eng in ENGINES}
-        self._last_call = {eng: 0.0 for eng in ENGINES}
+        self._conds = {eng: threading.Condition() for eng in ENGINES}
+        self._calls = {eng: deque() for eng in ENGINES}
 
-    def wait(self, engine_name):
-        with self._locks[engine_name]:
-            delay = ENGINE_DELAYS.get(engine_name, 1.5)
-            elapsed = time.time() - self._last_call[engine_name]
-            if elapsed < delay:
-                time.sleep(delay - elapsed)
-            self._last_call[engine_name] = time.time()
+    def acquire(self, engine_name):
+        max_calls = ENGINE_RATE_LIMITS.get(engine_name, 30)
+        calls = self._calls[engine_name]
+        cond = self._conds[engine_name]
+        with cond:
+            while True:
+                now = time.monotonic()
+                while calls and now - calls[0] >= RATE_LIMIT_PERIOD:
+                    calls.popleft()
+                if len(calls) < max_calls:
+                    calls.append(now)
+                    return
+                cond.wait(calls[0] + RATE_LIMIT_PERIOD - now)
 
 
 class BenchmarkEngine:
     def __init__(self, trigger_type="manual"):
         self.db = DatabaseManager()
-        self.grok = GrokWebSearchClient()
-        self.claude = ClaudeParametricClient()
-        self.openai = OpenAISearchClient()
-        self.parser = ResponseParser()
+        self.parser = ResponseParser(self.db)
         self.metrics = MetricsCalculator(self.db)
+        self.llm_cache = LLMCache(self.db)
         self.trigger_type = trigger_type
-        self._clients = {
-            "grok_web_search": self.grok,
-            "chatgpt_web_search": self.openai,
-            "claude_parametric": self.claude,
-        }
+        self._clients = {eng: CLIENT_FACTORIES[eng]() for eng in ENGINES}
         self._rate_limiter = _RateLimiter()
 
-    def _get_completed_pairs(self, run_id):
-        """Return set of (query_id, engine) pairs already completed for this run."""
-        rows = self.db.query(
-            "SELECT query_id, llm_engine FROM responses WHERE run_id = ? AND model_name != 'error'",
-            (run_id,),
-        )
-        return {(r["query_id"], r["llm_engine"]) for r in rows}
-
-    def _run_single(self, run_id, qid, qtxt, engine_name):
-        """Execute a single (query, engine) pair. Thread-safe."""
-        label = {"grok_web_search": "Grok", "chatgpt_web_search": "ChatGPT", "claude_parametric": "Claude"}[engine_name]
+    def _query_batch(self, engine_name, query_texts):
+        """Run one Batch API job for an engine; {query_text: result}, empty if the job failed."""
         try:
-            self._rate_limiter.wait(engine_name)
-            client = self._clients[engine_name]
-            result = client.query(qtxt)
-
-            # Use a dedicated DB connection per thread
-            db = DatabaseManager()
-            resp_id = db.store_response(
-                run_id=run_id, query_id=qid, llm_engine=engine_name,
-                model_name=result["model"], raw_response=result["raw_response"],
-                metadata=result["usage"],
-            )
+            return self._clients[engine_name].query_batch(query_texts)
+        except Exception as e:
+            logger.error(f"{ENGINE_LABELS[engine_name]} batch failed, querying synchronously: {e}")
+            return {}
+
+    def _run_single(self, run_id, qid, qtxt, engine_name, batch=None):
+        """Query one engine (API stage). Thread-safe.
 
-            parsed = self.parser.parse_response(result["raw_response"])
-            for mention in parsed.get("mentions", []):
-                db.store_mention(
-                    response_id=resp_id, run_id=run_id, query_id=qid,
-                    brand=mention["brand"], mention_position=mention["position"],
-                    mention_context=mention["context"], sentiment=mention["sentiment"],
-                    sentiment_score=mention["sentiment_score"],
-                    is_primary=mention["is_primary_recommendation"],
-                    llm_engine=engine_name,
-                )
-            for citation in result.get("citations", []):
-                if citation.get("url"):
-                    db.store_citation(
-                        response_id=resp_id, run_id=run_id, query_id=qid,
-                        url=citation["url"], title=citation.get("title", ""),
-                        llm_engine=engine_name,
-                    )
-
-            return {"status": "ok", "engine": label, "query_id": qid}
+        The answer is only stored once parsed, together with its mentions, so a run killed in
+        between re-queries the pair on resume instead of keeping a response with no mentions.
+        batch is a Future of a _query_batch job covering this engine; its answer is used when it has one.
+        """
+        label = ENGINE_LABELS[engine_name]
+        try:
+            result = batch.result().get(qtxt) if batch is not None else None
+            if result is not None:
+                self.llm_cache.put(engine_name, qtxt, result)
+            else:
+                result = self.llm_cache.get(engine_name, qtxt)
+            if result is None:
+                self._rate_limiter.acquire(engine_name)
+                result = self._clients[engine_name].query(qtxt)
+                self.llm_cache.put(engine_name, qtxt, result)
+
+            return {"status": "ok", "engine": label, "query_id": qid, "result": result}
 
         except Exception as e:
             logger.error(f"{label} error for query {qid}: {e}")
             try:
-                db = DatabaseManager()
-                db.log_error(run_id, qid, engine_name, str(e))
+                self.db.log_error(run_id, qid, engine_name, str(e))
             except Exception:
                 pass
             return {"status": f"error: {str(e)[:80]}", "engine": label, "query_id": qid, "error": str(e)}
 
-    def run(self, progress_callback=None, run_id=None, max_workers=9) -> int:
+    def _parse_and_store(self, batch, write_q):
+        """Extract mentions for a batch of (qid, engine, result) with one parser call and queue each
+        answer with them for the writer (parse stage). Errors propagate to the caller's future."""
+        parsed_rows = self.parser.parse_responses([result["raw_response"] for _, _, result in batch])
+        for (qid, engine_name, result), parsed in zip(batch, parsed_rows):
+            write_q.put((qid, engine_name, result, parsed.get("mentions", [])))
+
+    @staticmethod
+    def _write_rows(item):
+        _, _, result, mentions = item
+        return 1 + len(mentions) + len(result.get("citations", []))
+
+    def _drain_writes(self, run_id, write_q):
+        """Writer: commit each queued response with its mentions and citations, batched into
+        transactions, until None arrives.
+
+        After a failed commit the remaining items are drained unwritten (so producers never block
+        on a full queue) and the error is re-raised once None arrives; the run stays resumable and
+        the lost pairs are re-queried.
+        """
+        error = None
+        while True:
+            item = write_q.get()
+            if item is None:
+                break
+            batch = [item]
+            batch_rows = self._write_rows(item)
+            deadline = time.monotonic() + WRITE_FLUSH_SECONDS
+            stopping = False
+            while batch_rows < WRITE_BATCH_ROWS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = write_q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                batch_rows += self._write_rows(item)
+
+            if error is None:
+                try:
+                    with self.db.transaction():
+                        mention_rows, citation_rows = [], []
+                        for qid, engine_name, result, mentions in batch:
+                            metadata = result["usage"]
+                            if "cached_at" in result:
+                                # Replayed from the LLM cache rather than asked in this run
+                                metadata = {**metadata, "cached_at": result["cached_at"]}
+                            resp_id = self.db.store_response(
+                                run_id=run_id, query_id=qid, llm_engine=engine_name,
+                                model_name=result["model"], raw_response=result["raw_response"],
+                                metadata=metadata,
+                            )
+                            mention_rows.extend(
+                                (resp_id, run_id, qid, m["brand"], m["position"], m["context"],
+                                 m["sentiment"], m["sentiment_score"], m["is_primary_recommendation"], engine_name)
+                                for m in mentions
+                            )
+                            citation_rows.extend(
+                                (resp_id, run_id, qid, c["url"], c.get("title", ""), engine_name)
+                                for c in result.get("citations", [])
+                            )
+                        self.db.store_mentions_bulk(mention_rows)
+                        self.db.store_citations_bulk(citation_rows)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(batch)} responses ({batch_rows} rows): {e}")
+                    error = e
+            if stopping:
+                break
+        if error is not None:
+            raise error
+
+    def run(self, progress_callback=None, run_id=None, max_workers=None) -> int:
         """Run the benchmark with parallel execution.
 
-        max_workers=9 means up to 3 queries x 3 engines running concurrently.
+        Each engine has its own pool of ENGINE_MAX_CONCURRENCY workers (max_workers overrides it),
+        so a slow or rate-limited engine never holds threads the other engines could use.
         If run_id is provided, resume that run (skipping completed pairs).
         """
         self.db.seed_queries(QUERY_LIBRARY)
@@ -123,17 +239,12 @@ class BenchmarkEngine:
                 trigger_type=self.trigger_type,
             )
 
-        completed = self._get_completed_pairs(run_id)
-
-        # Build work items: all (query, engine) pairs not yet completed
-        work_items = []
-        for query in active_queries:
-            for engine_name in ENGINES:
-                if (query["id"], engine_name) not in completed:
-                    work_items.append((query["id"], query["query_text"], engine_name))
+        # All (query, engine) pairs not yet completed, filtered in SQL
+        work_items = self.db.get_pending_work_items(run_id, ENGINES)
 
         total_steps = len(active_queries) * len(ENGINES)
-        done_count = len(completed)
+        done_count = total_steps - len(work_items)
+        last_written_progress = done_count // len(ENGINES)
 
         if not work_items:
             # Everything already done, just compute metrics
@@ -141,31 +252,90 @@ class BenchmarkEngine:
             self.db.complete_run(run_id)
             return run_id
 
+        pool_sizes = {eng: max_workers or ENGINE_MAX_CONCURRENCY.get(eng, 3) for eng in ENGINES}
         if progress_callback:
-            progress_callback(done_count, total_steps, f"Starting {len(work_items)} tasks ({max_workers} parallel)...")
+            progress_callback(
+                done_count, total_steps,
+                f"Starting {len(work_items)} tasks ({sum(pool_sizes.values())} parallel)...",
+            )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # API workers hand finished answers to a separate parser pool so they can move on to the
+        # next query while the previous answer is being parsed; parsed answers go to a single
+        # writer thread, so neither stage waits on SQLite commits
+        write_q = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        with ExitStack() as stack:
+            writer = stack.enter_context(ThreadPoolExecutor(max_workers=1)).submit(
+                self._drain_writes, run_id, write_q,
+            )
+            # Exit callbacks run in reverse: this one fires once the parse pool below has drained,
+            # so the writer sees every answer before it stops
+            stack.callback(write_q.put, None)
+            parse_pool = stack.enter_context(ThreadPoolExecutor(max_workers=PARSE_WORKERS))
+            engine_pools = {
+                eng: stack.enter_context(ThreadPoolExecutor(max_workers=size))
+                for eng, size in pool_sizes.items()
+            }
+            # Scheduled runs aren't waiting on anyone: batch-capable engines answer their uncached
+            # queries through one Batch API job, submitted first so it takes one of the engine's
+            # workers while the others wait on it
+            batches = {}
+            if self.trigger_type == "scheduled":
+                for eng in BATCH_ENGINES_SCHEDULED:
+                    if eng not in engine_pools or not hasattr(self._clients[eng], "query_batch"):
+                        continue
+                    texts = [qtxt for _, qtxt, e in work_items
+                             if e == eng and self.llm_cache.get(eng, qtxt) is None]
+                    if texts:
+                        batches[eng] = engine_pools[eng].submit(self._query_batch, eng, texts)
             futures = {
-                executor.submit(self._run_single, run_id, qid, qtxt, eng): (qid, eng)
+                engine_pools[eng].submit(self._run_single, run_id, qid, qtxt, eng, batches.get(eng)): (qid, eng)
                 for qid, qtxt, eng in work_items
             }
 
-            for future in as_completed(futures):
-                done_count += 1
-                result = future.result()
-                label = result.get("engine", "?")
-                qid = result.get("query_id", "?")
-                status = result.get("status", "?")
-
-                if progress_callback:
-                    progress_callback(
-                        done_count, total_steps,
-                        f"[{done_count}/{total_steps}] {label} q{qid}: {status}"
-                    )
-
-                # Update progress every few completions
-                if done_count % 3 == 0:
-                    self.db.update_run_progress(run_id, completed_queries=done_count // len(ENGINES))
+            parse_futures = []
+            # Answers are buffered into parser batches; wait() wakes at flush_at so a partial batch
+            # still goes out while the remaining engines are slow
+            to_parse = []
+            flush_at = None
+            pending = set(futures)
+            while pending:
+                timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+                finished, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done_count += 1
+                    result = future.result()
+                    if "result" in result:
+                        qid, eng = futures[future]
+                        to_parse.append((qid, eng, result["result"]))
+                        if flush_at is None:
+                            flush_at = time.monotonic() + PARSE_FLUSH_SECONDS
+                        if len(to_parse) >= PARSE_BATCH_SIZE:
+                            parse_futures.append(parse_pool.submit(self._parse_and_store, to_parse, write_q))
+                            to_parse, flush_at = [], None
+                    label = result.get("engine", "?")
+                    qid = result.get("query_id", "?")
+                    status = result.get("status", "?")
+
+                    if progress_callback:
+                        progress_callback(
+                            done_count, total_steps,
+                            f"[{done_count}/{total_steps}] {label} q{qid}: {status}"
+                        )
+
+                    # Only write when the completed-query count actually changes
+                    progress = done_count // len(ENGINES)
+                    if progress != last_written_progress:
+                        self.db.update_run_progress(run_id, completed_queries=progress)
+                        last_written_progress = progress
+
+                if to_parse and (not pending or time.monotonic() >= flush_at):
+                    parse_futures.append(parse_pool.submit(self._parse_and_store, to_parse, write_q))
+                    to_parse, flush_at = [], None
+
+            # A failed parse leaves its answers unstored: fail the run so resume re-queries them
+            for future in parse_futures:
+                future.result()
+        writer.result()
 
         self.db.update_run_progress(run_id, completed_queries=len(active_queries))
         self.metrics.compute_daily_metrics(run_id)
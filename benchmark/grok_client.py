@@ -1,11 +1,26 @@
-import time
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from config.settings import _get_secret, XAI_RESPONSES_URL, GROK_DELAY_SECONDS
+from config.settings import _get_secret, XAI_RESPONSES_URL, ANALYST_SYSTEM_PROMPT
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
 
 
 GROK_MODEL = "grok-4-0709"
 
+# Static part of the request body, serialized once; query() only encodes the input string
+_PAYLOAD_PREFIX = _json_dumps({"model": GROK_MODEL, "tools": [{"type": "web_search"}]})[:-1] + b',"input":'
+
 
 class GrokWebSearchClient:
     def __init__(self):
@@ -14,69 +29,48 @@ class GrokWebSearchClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}",
         }
-        self._last_call = 0
-
-    def _wait(self):
-        elapsed = time.time() - self._last_call
-        if elapsed < GROK_DELAY_SECONDS:
-            time.sleep(GROK_DELAY_SECONDS - elapsed)
-        self._last_call = time.time()
+        # One pooled keep-alive session shared by all worker threads; tenacity handles retries
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=4, max=60),
-        retry=retry_if_exception_type((requests.exceptions.RequestException,)),
+        # ValueError covers a truncated/garbled JSON body, which resp.json() used to raise as a RequestException
+        retry=retry_if_exception_type((requests.exceptions.RequestException, ValueError)),
     )
     def query(self, query_text: str) -> dict:
-        self._wait()
+        body = _PAYLOAD_PREFIX + _json_dumps(f"{ANALYST_SYSTEM_PROMPT}\n\n{query_text}") + b"}"
 
-        system_msg = (
-            "You are a knowledgeable B2B marketing technology analyst. "
-            "When answering questions about webinar platforms and virtual event solutions, "
-            "provide comprehensive, balanced comparisons. Always cite your sources with URLs. "
-            "Focus on enterprise B2B use cases. When discussing Zoom, focus ONLY on "
-            "Zoom Webinars and Zoom Events (not Zoom Meetings or video conferencing)."
-        )
-
-        payload = {
-            "model": GROK_MODEL,
-            "input": f"{system_msg}\n\n{query_text}",
-            "tools": [{"type": "web_search"}],
-        }
-
-        resp = requests.post(XAI_RESPONSES_URL, headers=self.headers, json=payload, timeout=180)
+        resp = self.session.post(XAI_RESPONSES_URL, data=body, timeout=180)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         return self._parse(data)
 
     def _parse(self, data: dict) -> dict:
-        full_text = ""
-        citations = []
+        text_parts = []
+        citations = {}  # url -> citation; first occurrence wins, insertion order kept
 
-        for item in data.get("output", []):
+        for item in data.get("output", ()):
             # Items with content array (the actual response text)
-            if "content" in item and isinstance(item["content"], list):
-                for block in item["content"]:
-                    if block.get("type") == "output_text":
-                        full_text += block.get("text", "")
-                        for ann in block.get("annotations", []):
-                            if ann.get("type") == "url_citation":
-                                citations.append({
-                                    "url": ann.get("url", ""),
-                                    "title": ann.get("title", ""),
-                                })
-
-        # Deduplicate citations by URL
-        seen = set()
-        unique_citations = []
-        for c in citations:
-            if c["url"] not in seen:
-                seen.add(c["url"])
-                unique_citations.append(c)
+            content = item.get("content")
+            if not content or not isinstance(content, list):
+                continue
+            for block in content:
+                if block.get("type") != "output_text":
+                    continue
+                text = block.get("text")
+                if text:
+                    text_parts.append(text)
+                for ann in block.get("annotations", ()):
+                    url = ann.get("url")
+                    if url and ann.get("type") == "url_citation":
+                        citations.setdefault(url, {"url": url, "title": ann.get("title", "")})
 
         return {
-            "raw_response": full_text,
-            "citations": unique_citations,
+            "raw_response": "".join(text_parts),
+            "citations": list(citations.values()),
             "model": data.get("model", GROK_MODEL),
             "usage": data.get("usage", {}),
         }
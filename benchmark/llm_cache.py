@@ -0,0 +1,32 @@
+"""Reuse recent engine answers for identical (or trivially reworded) queries."""
+
+import hashlib
+import re
+from config.settings import LLM_CACHE_TTL_HOURS
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def normalize_query(query_text: str) -> str:
+    """Casefold and collapse punctuation/whitespace so near-identical phrasings share an entry."""
+    return _NON_WORD_RE.sub(" ", query_text.casefold()).strip()
+
+
+class LLMCache:
+    def __init__(self, db, ttl_hours=LLM_CACHE_TTL_HOURS):
+        self.db = db
+        self.ttl_hours = ttl_hours
+
+    @staticmethod
+    def _key(engine_name, query_text):
+        return hashlib.sha256(f"{engine_name}\n{normalize_query(query_text)}".encode()).hexdigest()
+
+    def get(self, engine_name, query_text):
+        if not self.ttl_hours:
+            return None
+        return self.db.get_cached_llm_response(self._key(engine_name, query_text), self.ttl_hours)
+
+    def put(self, engine_name, query_text, result):
+        if not self.ttl_hours:
+            return
+        self.db.store_cached_llm_response(self._key(engine_name, query_text), engine_name, query_text, result)
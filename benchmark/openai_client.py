@@ -1,7 +1,6 @@
-import time
 from openai import OpenAI, RateLimitError, APIConnectionError, InternalServerError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from config.settings import _get_secret, OPENAI_MODEL, OPENAI_DELAY_SECONDS
+from config.settings import _get_secret, OPENAI_MODEL, ANALYST_SYSTEM_PROMPT
 
 
 class OpenAISearchClient:
@@ -13,13 +12,6 @@ class OpenAISearchClient:
             raise ValueError("OPENAI_API_KEY not found in environment or Streamlit secrets")
         self.client = OpenAI(api_key=api_key)
         self.model = OPENAI_MODEL
-        self._last_call = 0
-
-    def _wait(self):
-        elapsed = time.time() - self._last_call
-        if elapsed < OPENAI_DELAY_SECONDS:
-            time.sleep(OPENAI_DELAY_SECONDS - elapsed)
-        self._last_call = time.time()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -27,21 +19,11 @@ class OpenAISearchClient:
         retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
     )
     def query(self, query_text: str) -> dict:
-        self._wait()
-
-        system_msg = (
-            "You are a knowledgeable B2B marketing technology analyst. "
-            "When answering questions about webinar platforms and virtual event solutions, "
-            "provide comprehensive, balanced comparisons. Always cite your sources with URLs. "
-            "Focus on enterprise B2B use cases. When discussing Zoom, focus ONLY on "
-            "Zoom Webinars and Zoom Events (not Zoom Meetings or video conferencing)."
-        )
-
         # Try responses API with web search first, fall back to chat completions
         try:
-            return self._query_with_web_search(system_msg, query_text)
+            return self._query_with_web_search(ANALYST_SYSTEM_PROMPT, query_text)
         except Exception:
-            return self._query_chat_completions(system_msg, query_text)
+            return self._query_chat_completions(ANALYST_SYSTEM_PROMPT, query_text)
 
     def _query_with_web_search(self, system_msg: str, query_text: str) -> dict:
         """Use OpenAI Responses API with web_search tool."""
@@ -52,7 +34,7 @@ class OpenAISearchClient:
         )
 
         full_text = ""
-        citations = []
+        citations = {}  # url -> citation; first occurrence wins, insertion order kept
 
         for item in response.output:
             if hasattr(item, "content") and item.content:
@@ -61,23 +43,13 @@ class OpenAISearchClient:
                         full_text += block.text
                     if hasattr(block, "annotations"):
                         for ann in block.annotations:
-                            if hasattr(ann, "url") and ann.url:
-                                citations.append({
-                                    "url": ann.url,
-                                    "title": getattr(ann, "title", ""),
-                                })
-
-        # Deduplicate citations
-        seen = set()
-        unique_citations = []
-        for c in citations:
-            if c["url"] not in seen:
-                seen.add(c["url"])
-                unique_citations.append(c)
+                            url = getattr(ann, "url", None)
+                            if url:
+                                citations.setdefault(url, {"url": url, "title": getattr(ann, "title", "")})
 
         return {
             "raw_response": full_text,
-            "citations": unique_citations,
+            "citations": list(citations.values()),
             "model": self.model,
             "usage": {},
         }
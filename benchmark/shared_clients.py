@@ -0,0 +1,18 @@
+"""Process-wide API clients, shared so their HTTP connection pools are reused across calls."""
+
+import threading
+from config.settings import _get_secret
+
+_anthropic_client = None
+_anthropic_lock = threading.Lock()
+
+
+def get_anthropic_client():
+    """Create the Anthropic client on first use (secrets stay lazily resolved) and reuse it after."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        with _anthropic_lock:
+            if _anthropic_client is None:
+                import anthropic
+                _anthropic_client = anthropic.Anthropic(api_key=_get_secret("ANTHROPIC_API_KEY"))
+    return _anthropic_client
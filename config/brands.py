@@ -23,3 +23,7 @@ BRAND_DEFINITIONS = {
         "exclude_context": "zoom meetings|video conferencing|zoom phone|zoom rooms",
     },
 }
+
+# Short names and dashboard chart colors (keyed by short name, as plotly colors by label)
+BRAND_DISPLAY = {"on24": "ON24", "goldcast": "Goldcast", "zoom": "Zoom"}
+BRAND_COLOR = {"ON24": "#1E88E5", "Goldcast": "#FFC107", "Zoom": "#43A047"}
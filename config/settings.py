@@ -24,6 +24,15 @@ ANTHROPIC_API_KEY = _get_secret("ANTHROPIC_API_KEY")
 XAI_API_KEY = _get_secret("XAI_API_KEY")
 OPENAI_API_KEY = _get_secret("OPENAI_API_KEY")
 
+# System prompt shared by the web-search engines (Grok, ChatGPT)
+ANALYST_SYSTEM_PROMPT = (
+    "You are a knowledgeable B2B marketing technology analyst. "
+    "When answering questions about webinar platforms and virtual event solutions, "
+    "provide comprehensive, balanced comparisons. Always cite your sources with URLs. "
+    "Focus on enterprise B2B use cases. When discussing Zoom, focus ONLY on "
+    "Zoom Webinars and Zoom Events (not Zoom Meetings or video conferencing)."
+)
+
 # xAI Grok Configuration
 XAI_BASE_URL = "https://api.x.ai/v1"
 XAI_RESPONSES_URL = f"{XAI_BASE_URL}/responses"
@@ -31,17 +40,29 @@ GROK_MODEL = "grok-4-0709"
 
 # OpenAI Configuration
 OPENAI_MODEL = "gpt-4o"
-OPENAI_DELAY_SECONDS = 1.5
 
 # Claude Configuration
 CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
 CLAUDE_MODEL_RECOMMENDATIONS = "claude-sonnet-4-5-20250929"
 
-# Rate Limiting
+# Engines queried by a benchmark run; removing one also skips importing its SDK
+ENGINES_ENABLED = ["grok_web_search", "chatgpt_web_search", "claude_parametric"]
+
+# Rate Limiting (requests per minute, enforced per engine by BenchmarkEngine)
 GROK_RPM = 30
-GROK_DELAY_SECONDS = 2.5
 CLAUDE_RPM = 50
-CLAUDE_DELAY_SECONDS = 1.5
+OPENAI_RPM = 60
+
+# LLM response cache, opt-in: set a window in hours to let reruns within it reuse stored engine
+# answers instead of querying again (responses served this way carry cached_at in their metadata).
+# Off by default, so every benchmark run measures fresh answers
+LLM_CACHE_TTL_HOURS = 0
+
+# Scheduled runs send these engines' queries through the provider's Batch API (half price, no RPM cap);
+# anything unanswered after BATCH_MAX_WAIT_MINUTES is queried synchronously as usual
+BATCH_ENGINES_SCHEDULED = ["claude_parametric"]
+BATCH_MAX_WAIT_MINUTES = 15
+BATCH_POLL_SECONDS = 30
 
 # Database
 DB_PATH = str(PROJECT_ROOT / "data" / "geo_benchmark.db")
@@ -0,0 +1,8 @@
+"""Process-wide DatabaseManager for the Streamlit pages, kept across reruns and sessions."""
+import streamlit as st
+from db.database import DatabaseManager
+
+
+@st.cache_resource
+def get_db():
+    return DatabaseManager()
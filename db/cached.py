@@ -0,0 +1,38 @@
+"""Streamlit-cached wrappers around the read queries the dashboard pages rerun on every interaction."""
+import streamlit as st
+from db._singleton import get_db
+from analysis.trends import TrendAnalyzer
+
+CACHE_TTL_SECONDS = 300
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def latest_sov(run_id, engine):
+    return get_db().get_latest_sov(engine, run_id=run_id)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def search_term_breakdown(run_id, engine):
+    return get_db().get_search_term_breakdown(run_id, engine, frame=True)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def category_summary(run_id, engine):
+    return get_db().get_category_summary(run_id, engine, frame=True)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def all_trends(engine, days):
+    return TrendAnalyzer(get_db()).get_all_trends(engine, days, frame=True)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def completed_runs():
+    return [r for r in get_db().get_all_runs() if r["status"] == "completed"]
+
+
+def refresh_button():
+    """Sidebar button that drops every cached query result so the page reloads fresh data."""
+    if st.sidebar.button("Refresh data"):
+        st.cache_data.clear()
+        st.rerun()
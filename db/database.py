@@ -1,75 +1,209 @@
 import os
+import hashlib
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from urllib.parse import urlparse
 from config.settings import DB_PATH
 from config.brands import BRAND_DEFINITIONS
 
 
+_MENTION_INSERT_SQL = """INSERT INTO mentions (response_id, run_id, query_id, brand, mention_position,
+    mention_context, sentiment, sentiment_score, is_primary_recommendation, llm_engine)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_CITATION_INSERT_SQL = """INSERT INTO citations (response_id, run_id, query_id, url, url_domain,
+    title, brand_association, is_on24_www, is_on24_event, llm_engine)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Stored in PRAGMA user_version once schema.sql has been applied; bump it whenever schema.sql changes
+SCHEMA_VERSION = 4
+
+_DAILY_METRIC_COLUMNS = (
+    "run_date", "run_id", "query_id", "query_category", "llm_engine", "brand",
+    "is_mentioned", "mention_count", "first_mention_position",
+    "is_primary_recommendation", "avg_sentiment_score", "dominant_sentiment",
+    "citation_count", "www_citation_count", "event_citation_count",
+)
+_DAILY_METRIC_KEY = ("run_id", "query_id", "llm_engine", "brand")
+
+# Recomputing a run updates rows in place; is_winner is left to the winner pass
+_DAILY_METRIC_UPSERT_SQL = (
+    f"INSERT INTO daily_metrics ({', '.join(_DAILY_METRIC_COLUMNS)}, is_winner) "
+    f"VALUES ({', '.join('?' for _ in _DAILY_METRIC_COLUMNS)}, 0) "
+    f"ON CONFLICT({', '.join(_DAILY_METRIC_KEY)}) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _DAILY_METRIC_COLUMNS if c not in _DAILY_METRIC_KEY)
+)
+
+# Dashboard SOV aggregates over one run's daily_metrics; callers append the GROUP BY
+_RUN_SUMMARY_SELECT = """SELECT run_id, llm_engine, brand,
+    ROUND(AVG(is_mentioned) * 100, 1) AS sov,
+    ROUND(AVG(first_mention_position), 2) AS avg_position,
+    ROUND(AVG(avg_sentiment_score), 3) AS avg_sentiment,
+    ROUND(AVG(is_winner) * 100, 1) AS win_rate
+    FROM daily_metrics WHERE run_id = ?"""
+
+# Citation domain -> brand, checked in order; first substring match wins
+_DOMAIN_RULES = (("on24.com", "on24"), ("goldcast.io", "goldcast"), ("zoom.us", "zoom"))
+
+
 class DatabaseManager:
     def __init__(self, db_path=None):
         self.db_path = db_path or DB_PATH
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._local = threading.local()
+        self._query_index = None
         self._init_db()
 
     def _get_conn(self):
-        conn = sqlite3.connect(self.db_path)
+        """Return this thread's connection, opening and configuring it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        # Room for every distinct statement the app issues, so hot getters never re-prepare
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        # NORMAL is durable against app crashes under WAL; only an OS crash can lose the last
+        # commits, which a re-run regenerates, so analytics data doesn't need FULL fsyncs
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache for trend GROUP BYs
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # read pages via a 256 MiB memory map
+        self._local.conn = conn
         return conn
 
+    def close(self):
+        """Close the calling thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
+        conn = self._get_conn()
+        if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
         schema_path = os.path.join(os.path.dirname(__file__), "schema.sql")
         with open(schema_path, "r") as f:
             schema_sql = f.read()
-        conn = self._get_conn()
         conn.executescript(schema_sql)
-        conn.close()
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def query(self, sql, params=None):
+        # Iterate the cursor directly so no intermediate list of Row objects is built
+        return [dict(row) for row in self._get_conn().execute(sql, params or ())]
+
+    def read_df(self, sql, params=None):
+        """Run a query straight into a pandas DataFrame, skipping the per-row dict conversion."""
+        import pandas as pd  # dashboard-only dependency; the benchmark path never loads it
+        return pd.read_sql_query(sql, self._get_conn(), params=params or ())
+
+    def iter_query(self, sql, params=None, batch_size=1000):
+        """Yield rows as dicts, fetching batch_size at a time instead of materializing the result."""
+        cursor = self._get_conn().execute(sql, params or ())
+        try:
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """Group this thread's writes into one BEGIN IMMEDIATE ... COMMIT; nested blocks join the outer one."""
         conn = self._get_conn()
-        cursor = conn.execute(sql, params or ())
-        rows = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return rows
+        if getattr(self._local, "in_transaction", False):
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.in_transaction = True
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_transaction = False
+
+    def _write_scope(self, conn):
+        # Inside transaction() the outer block commits; otherwise each write commits on its own
+        return nullcontext() if getattr(self._local, "in_transaction", False) else conn
 
     def execute(self, sql, params=None):
         conn = self._get_conn()
-        cursor = conn.execute(sql, params or ())
-        conn.commit()
-        last_id = cursor.lastrowid
-        conn.close()
-        return last_id
+        # commit, or roll back so a failed write can't leak into the next commit
+        with self._write_scope(conn):
+            cursor = conn.execute(sql, params or ())
+        return cursor.lastrowid
 
     def executemany(self, sql, params_list):
         conn = self._get_conn()
-        conn.executemany(sql, params_list)
-        conn.commit()
-        conn.close()
+        with self._write_scope(conn):
+            conn.executemany(sql, params_list)
 
     # --- Queries ---
     def seed_queries(self, query_library):
+        """Insert the query library, skipping the work when it is unchanged since the last seed."""
+        lib_hash = hashlib.sha256(json.dumps(query_library, sort_keys=True).encode()).hexdigest()
+        rows = self.query("SELECT value FROM meta WHERE key = 'query_library_hash'")
+        if rows and rows[0]["value"] == lib_hash:
+            return
+
         conn = self._get_conn()
-        for q in query_library:
-            conn.execute(
+        with conn:
+            conn.executemany(
                 "INSERT OR IGNORE INTO queries (query_text, category, subcategory) VALUES (?, ?, ?)",
-                (q["query_text"], q["category"], q.get("subcategory")),
+                [(q["query_text"], q["category"], q.get("subcategory")) for q in query_library],
             )
-        conn.commit()
-        conn.close()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('query_library_hash', ?)",
+                (lib_hash,),
+            )
+        conn.execute("ANALYZE")  # refresh planner statistics so the composite indexes get picked
+        self._query_index = None
 
     def get_active_queries(self):
         return self.query("SELECT * FROM queries WHERE is_active = 1 ORDER BY id")
 
-    def get_query_text(self, query_id):
-        rows = self.query("SELECT query_text FROM queries WHERE id = ?", (query_id,))
-        return rows[0]["query_text"] if rows else None
+    def get_pending_work_items(self, run_id, engines):
+        """(query_id, query_text, engine) for active queries without a successful response in the run.
+
+        The engine stores a response in the same transaction as its mentions and citations, so a
+        stored response is always a parsed one and nothing here needs re-parsing.
+        """
+        engine_values = ", ".join(f"(?, {i})" for i in range(len(engines)))
+        rows = self.query(
+            f"""WITH engines(name, ord) AS (VALUES {engine_values})
+               SELECT q.id, q.query_text, e.name AS engine
+               FROM queries q
+               CROSS JOIN engines e
+               WHERE q.is_active = 1
+                 AND NOT EXISTS (
+                     SELECT 1 FROM responses r
+                     WHERE r.run_id = ? AND r.llm_engine = e.name
+                       AND r.model_name != 'error' AND r.query_id = q.id
+                 )
+               ORDER BY q.id, e.ord""",
+            (*engines, run_id),
+        )
+        return [(r["id"], r["query_text"], r["engine"]) for r in rows]
 
-    def get_query_category(self, query_id):
-        rows = self.query("SELECT category FROM queries WHERE id = ?", (query_id,))
-        return rows[0]["category"] if rows else None
+    def load_query_index(self):
+        """{query_id: {"text", "category"}} for every query, cached until the library is re-seeded."""
+        if self._query_index is None:
+            self._query_index = {
+                r["id"]: {"text": r["query_text"], "category": r["category"]}
+                for r in self.query("SELECT id, query_text, category FROM queries")
+            }
+        return self._query_index
 
     # --- Benchmark Runs ---
     def create_run(self, run_date, total_queries, trigger_type="manual"):
@@ -95,10 +229,15 @@ class DatabaseManager:
         )
 
     def complete_run(self, run_id):
-        self.execute(
-            "UPDATE benchmark_runs SET status = 'completed', completed_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), run_id),
-        )
+        with self.transaction():
+            self.execute(
+                f"INSERT OR REPLACE INTO run_summary {_RUN_SUMMARY_SELECT} GROUP BY llm_engine, brand",
+                (run_id,),
+            )
+            self.execute(
+                "UPDATE benchmark_runs SET status = 'completed', completed_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), run_id),
+            )
 
     def fail_run(self, run_id, error_message):
         self.execute(
@@ -122,46 +261,108 @@ class DatabaseManager:
             (run_id, query_id, llm_engine, model_name, raw_response, json.dumps(metadata) if metadata else None),
         )
 
-    def get_responses_for_run(self, run_id):
-        return self.query(
-            "SELECT * FROM responses WHERE run_id = ? AND model_name != 'error' ORDER BY id",
-            (run_id,),
+    # --- Parsed response cache ---
+    def get_cached_parse(self, response_hash):
+        rows = self.query("SELECT parsed_json FROM parsed_response_cache WHERE hash = ?", (response_hash,))
+        return json.loads(rows[0]["parsed_json"]) if rows else None
+
+    def store_cached_parse(self, response_hash, parsed):
+        self.execute(
+            "INSERT OR REPLACE INTO parsed_response_cache (hash, parsed_json) VALUES (?, ?)",
+            (response_hash, json.dumps(parsed)),
         )
 
-    # --- Mentions ---
-    def store_mention(self, response_id, run_id, query_id, brand, mention_position,
-                      mention_context, sentiment, sentiment_score, is_primary, llm_engine):
-        return self.execute(
-            """INSERT INTO mentions (response_id, run_id, query_id, brand, mention_position,
-               mention_context, sentiment, sentiment_score, is_primary_recommendation, llm_engine)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (response_id, run_id, query_id, brand, mention_position,
-             mention_context, sentiment, sentiment_score, 1 if is_primary else 0, llm_engine),
+    # --- LLM response cache ---
+    def get_cached_llm_response(self, cache_key, max_age_hours):
+        rows = self.query(
+            """SELECT model_name, raw_response, citations_json, usage_json, created_at FROM llm_cache
+               WHERE cache_key = ? AND created_at >= datetime('now', ?)""",
+            (cache_key, f"-{max_age_hours} hours"),
         )
+        if not rows:
+            return None
+        row = rows[0]
+        return {
+            "raw_response": row["raw_response"],
+            "citations": json.loads(row["citations_json"]) if row["citations_json"] else [],
+            "model": row["model_name"],
+            "usage": json.loads(row["usage_json"]) if row["usage_json"] else {},
+            "cached_at": row["created_at"],
+        }
 
-    def get_mentions_for_response(self, response_id):
-        return self.query("SELECT * FROM mentions WHERE response_id = ?", (response_id,))
+    def store_cached_llm_response(self, cache_key, llm_engine, query_text, result):
+        self.execute(
+            """INSERT OR REPLACE INTO llm_cache
+               (cache_key, llm_engine, query_text, model_name, raw_response, citations_json, usage_json)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (cache_key, llm_engine, query_text, result["model"], result["raw_response"],
+             json.dumps(result.get("citations", [])), json.dumps(result.get("usage", {}))),
+        )
 
-    # --- Citations ---
-    def store_citation(self, response_id, run_id, query_id, url, title, llm_engine):
-        classification = self._classify_citation_domain(url)
-        return self.execute(
-            """INSERT INTO citations (response_id, run_id, query_id, url, url_domain,
-               title, brand_association, is_on24_www, is_on24_event, llm_engine)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (response_id, run_id, query_id, url, classification["url_domain"],
-             title, classification["brand_association"],
-             classification["is_on24_www"], classification["is_on24_event"], llm_engine),
+    # --- Recommendations cache ---
+    def get_cached_recommendations(self, run_id, completed_at, model_name):
+        rows = self.query(
+            """SELECT recommendations_json FROM recommendations_cache
+               WHERE run_id = ? AND completed_at IS ? AND model_name = ?""",
+            (run_id, completed_at, model_name),
         )
+        return json.loads(rows[0]["recommendations_json"]) if rows else None
 
-    def get_citations_for_response(self, response_id):
-        return self.query("SELECT * FROM citations WHERE response_id = ?", (response_id,))
+    def store_cached_recommendations(self, run_id, completed_at, model_name, recs):
+        self.execute(
+            """INSERT OR REPLACE INTO recommendations_cache
+               (run_id, completed_at, model_name, recommendations_json) VALUES (?, ?, ?, ?)""",
+            (run_id, completed_at, model_name, json.dumps(recs)),
+        )
+
+    # --- Mentions ---
+    def store_mentions_bulk(self, rows):
+        """Insert mentions in one transaction; rows are (response_id, run_id, query_id, brand, mention_position,
+        mention_context, sentiment, sentiment_score, is_primary_recommendation, llm_engine)."""
+        if not rows:
+            return
+        self.executemany(_MENTION_INSERT_SQL, [(*r[:8], 1 if r[8] else 0, r[9]) for r in rows])
+
+    # --- Citations ---
+    def store_citations_bulk(self, rows):
+        """Insert citations in one transaction; rows are (response_id, run_id, query_id, url, title, llm_engine)."""
+        if not rows:
+            return
+        classifications = self.classify_many([r[3] for r in rows])
+        self.executemany(_CITATION_INSERT_SQL, [
+            (resp_id, run_id, qid, url, c["url_domain"], title, c["brand_association"],
+             c["is_on24_www"], c["is_on24_event"], engine)
+            for (resp_id, run_id, qid, url, title, engine), c in zip(rows, classifications)
+        ])
+
+    def get_citation_summary(self, run_id):
+        """Citation counts for a run in report buckets; each citation lands in the first bucket it matches."""
+        summary = dict.fromkeys(("on24_www", "on24_event", "goldcast", "zoom", "other"), 0)
+        for row in self.query(
+            """SELECT CASE WHEN is_on24_www THEN 'on24_www'
+                           WHEN is_on24_event THEN 'on24_event'
+                           WHEN brand_association IN ('goldcast', 'zoom') THEN brand_association
+                           ELSE 'other' END AS bucket,
+                      COUNT(*) AS n
+               FROM citations WHERE run_id = ? GROUP BY bucket""",
+            (run_id,),
+        ):
+            summary[row["bucket"]] = row["n"]
+        return summary
+
+    @classmethod
+    def classify_many(cls, urls):
+        """Classify a batch of citation URLs, parsing each distinct URL once."""
+        seen = {}
+        for url in urls:
+            if url not in seen:
+                seen[url] = cls._classify_citation_domain(url)
+        return [seen[url] for url in urls]
 
     @staticmethod
     def _classify_citation_domain(url):
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower().lstrip("www.") if parsed.netloc else ""
-        full_domain = parsed.netloc.lower() if parsed.netloc else ""
+        full_domain = urlparse(url).netloc.lower()
+        domain = full_domain.removeprefix("www.")
 
         result = {
             "url_domain": full_domain,
@@ -170,63 +371,128 @@ class DatabaseManager:
             "is_on24_event": 0,
         }
 
-        if "on24.com" in domain:
-            result["brand_association"] = "on24"
+        for needle, brand in _DOMAIN_RULES:
+            if needle in domain:
+                result["brand_association"] = brand
+                break
+
+        if result["brand_association"] == "on24":
             if "event.on24.com" in full_domain:
                 result["is_on24_event"] = 1
             else:
                 result["is_on24_www"] = 1
-        elif "goldcast.io" in domain:
-            result["brand_association"] = "goldcast"
-        elif "zoom.us" in domain:
-            result["brand_association"] = "zoom"
 
         return result
 
     # --- Daily Metrics ---
-    def store_daily_metric(self, **kwargs):
-        return self.execute(
-            """INSERT OR REPLACE INTO daily_metrics
-               (run_date, run_id, query_id, query_category, llm_engine, brand,
-                is_mentioned, mention_count, first_mention_position,
-                is_primary_recommendation, avg_sentiment_score, dominant_sentiment,
-                citation_count, www_citation_count, event_citation_count, is_winner)
-               VALUES (:run_date, :run_id, :query_id, :query_category, :llm_engine, :brand,
-                :is_mentioned, :mention_count, :first_mention_position,
-                :is_primary_recommendation, :avg_sentiment_score, :dominant_sentiment,
-                :citation_count, :www_citation_count, :event_citation_count, 0)""",
-            kwargs,
+    def get_aggregated_response_brand_stats(self, run_id, brands):
+        """Stream one row per (response, tracked brand) with mention and citation aggregates for a run.
+
+        dominant_sentiment is the most frequent sentiment label among the brand's mentions in the
+        response (ties go to the earliest mentioned label), or None when it has no mention.
+        """
+        brand_values = ", ".join(f"(?, {i})" for i in range(len(brands)))
+        return self.iter_query(
+            f"""WITH tracked(brand, ord) AS (VALUES {brand_values}),
+               m AS (
+                   SELECT response_id, brand,
+                          COUNT(*) AS mention_count,
+                          MIN(mention_position) AS first_mention_position,
+                          MAX(is_primary_recommendation) AS is_primary_recommendation,
+                          AVG(sentiment_score) AS avg_sentiment_score
+                   FROM mentions
+                   WHERE run_id = ?
+                   GROUP BY response_id, brand
+               ),
+               s AS (
+                   SELECT response_id, brand, sentiment,
+                          ROW_NUMBER() OVER (
+                              PARTITION BY response_id, brand
+                              ORDER BY COUNT(*) DESC, MIN(mention_position)
+                          ) AS rn
+                   FROM mentions
+                   WHERE run_id = ?
+                   GROUP BY response_id, brand, sentiment
+               ),
+               c AS (
+                   SELECT response_id, brand_association AS brand,
+                          COUNT(*) AS citation_count,
+                          SUM(is_on24_www) AS www_citation_count,
+                          SUM(is_on24_event) AS event_citation_count
+                   FROM citations
+                   WHERE run_id = ?
+                   GROUP BY response_id, brand_association
+               )
+               SELECT r.id AS response_id, r.query_id, r.llm_engine, t.brand,
+                      COALESCE(m.mention_count, 0) AS mention_count,
+                      m.first_mention_position,
+                      COALESCE(m.is_primary_recommendation, 0) AS is_primary_recommendation,
+                      CASE WHEN m.mention_count THEN COALESCE(m.avg_sentiment_score, 0.0) END AS avg_sentiment_score,
+                      s.sentiment AS dominant_sentiment,
+                      COALESCE(c.citation_count, 0) AS citation_count,
+                      COALESCE(c.www_citation_count, 0) AS www_citation_count,
+                      COALESCE(c.event_citation_count, 0) AS event_citation_count
+               FROM responses r
+               CROSS JOIN tracked t
+               LEFT JOIN m ON m.response_id = r.id AND m.brand = t.brand
+               LEFT JOIN s ON s.response_id = r.id AND s.brand = t.brand AND s.rn = 1
+               LEFT JOIN c ON c.response_id = r.id AND c.brand = t.brand
+               WHERE r.run_id = ? AND r.model_name != 'error'
+               ORDER BY r.id, t.ord""",
+            (*brands, run_id, run_id, run_id, run_id),
         )
 
+    def store_daily_metrics_batch(self, rows):
+        """Upsert daily_metrics rows (tuples in _DAILY_METRIC_COLUMNS order) in one transaction."""
+        if not rows:
+            return
+        self.executemany(_DAILY_METRIC_UPSERT_SQL, rows)
+
     def get_daily_metrics_for_run(self, run_id):
         return self.query("SELECT * FROM daily_metrics WHERE run_id = ?", (run_id,))
 
-    def set_winner(self, metric_id):
-        self.execute("UPDATE daily_metrics SET is_winner = 1 WHERE id = ?", (metric_id,))
-
     # --- Aggregation queries for dashboard ---
-    def get_latest_sov(self, engine="grok_web_search"):
-        run_id = self.get_latest_run_id()
+    def get_latest_sov(self, engine="grok_web_search", run_id=None):
+        if run_id is None:
+            run_id = self.get_latest_run_id()
         if not run_id:
             return []
+        rows = self.query(
+            """SELECT brand, sov, avg_position, avg_sentiment, win_rate
+               FROM run_summary WHERE run_id = ? AND llm_engine = ? ORDER BY brand""",
+            (run_id, engine),
+        )
+        if rows:
+            return rows
+        # Runs completed before run_summary existed
         return self.query(
-            """SELECT brand,
-                      ROUND(AVG(is_mentioned) * 100, 1) AS sov,
-                      ROUND(AVG(first_mention_position), 2) AS avg_position,
-                      ROUND(AVG(avg_sentiment_score), 3) AS avg_sentiment,
-                      ROUND(AVG(is_winner) * 100, 1) AS win_rate
-               FROM daily_metrics
-               WHERE run_id = ? AND llm_engine = ?
-               GROUP BY brand""",
+            f"""SELECT brand, sov, avg_position, avg_sentiment, win_rate FROM ({_RUN_SUMMARY_SELECT}
+                AND llm_engine = ? GROUP BY brand) ORDER BY brand""",
             (run_id, engine),
         )
 
-    def get_search_term_breakdown(self, run_id=None, engine="grok_web_search"):
+    def get_category_summary(self, run_id, engine="grok_web_search", frame=False):
+        """Mention rate, win rate and average sentiment per (category, brand), aggregated in SQL."""
+        return (self.read_df if frame else self.query)(
+            """SELECT q.category, dm.brand,
+                      ROUND(AVG(dm.is_mentioned) * 100, 1) AS mention_rate,
+                      ROUND(AVG(dm.is_winner) * 100, 1) AS win_rate,
+                      AVG(dm.avg_sentiment_score) AS avg_sentiment
+               FROM daily_metrics dm
+               JOIN queries q ON q.id = dm.query_id
+               WHERE dm.run_id = ? AND dm.llm_engine = ?
+               GROUP BY q.category, dm.brand
+               ORDER BY q.category, dm.brand""",
+            (run_id, engine),
+        )
+
+    def get_search_term_breakdown(self, run_id=None, engine="grok_web_search", frame=False):
+        """Per-(query, brand) metrics for a run; frame=True returns a DataFrame via read_df."""
         if run_id is None:
             run_id = self.get_latest_run_id()
-        if not run_id:
+        if not run_id and not frame:
             return []
-        return self.query(
+        return (self.read_df if frame else self.query)(
             """SELECT dm.query_id, q.query_text, q.category, dm.brand,
                       dm.is_mentioned, dm.first_mention_position,
                       dm.avg_sentiment_score, dm.is_primary_recommendation,
@@ -240,3 +506,44 @@ class DatabaseManager:
 
     def get_all_runs(self):
         return self.query("SELECT * FROM benchmark_runs ORDER BY id DESC")
+
+    # --- Generated reports ---
+    def record_report(self, run_id, path, size_bytes):
+        """Add or refresh a generated PDF in reports_index; rebuilding a file moves it to the top."""
+        self.execute(
+            """INSERT INTO reports_index (filename, run_id, size_bytes, created_at) VALUES (?, ?, ?, ?)
+               ON CONFLICT(filename) DO UPDATE SET run_id = excluded.run_id,
+                   size_bytes = excluded.size_bytes, created_at = excluded.created_at""",
+            (os.path.basename(path), run_id, size_bytes, datetime.now().isoformat()),
+        )
+
+    def list_reports(self, limit=10, offset=0):
+        """One page of reports_index, most recently generated first."""
+        return self.query(
+            "SELECT filename, run_id, size_bytes, created_at FROM reports_index "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def count_reports(self):
+        return self.query("SELECT COUNT(*) AS n FROM reports_index")[0]["n"]
+
+    def sync_reports_index(self, reports_dir):
+        """Reconcile reports_index with the PDFs actually in reports_dir (maintenance, not per page view)."""
+        on_disk = {}
+        if os.path.isdir(reports_dir):
+            with os.scandir(reports_dir) as entries:
+                for e in entries:
+                    if e.name.endswith(".pdf"):
+                        stat = e.stat()
+                        on_disk[e.name] = (stat.st_size, datetime.fromtimestamp(stat.st_mtime).isoformat())
+        indexed = {r["filename"] for r in self.query("SELECT filename FROM reports_index")}
+        with self.transaction():
+            self.executemany(
+                "DELETE FROM reports_index WHERE filename = ?",
+                [(name,) for name in indexed - on_disk.keys()],
+            )
+            self.executemany(
+                "INSERT INTO reports_index (filename, run_id, size_bytes, created_at) VALUES (?, NULL, ?, ?)",
+                [(name, *on_disk[name]) for name in on_disk.keys() - indexed],
+            )
@@ -1,3 +1,4 @@
+-- Bump SCHEMA_VERSION in db/database.py whenever this file changes.
 PRAGMA journal_mode=WAL;
 
 CREATE TABLE IF NOT EXISTS benchmark_runs (
@@ -41,6 +42,8 @@ CREATE TABLE IF NOT EXISTS responses (
 CREATE INDEX IF NOT EXISTS idx_responses_run ON responses(run_id);
 CREATE INDEX IF NOT EXISTS idx_responses_query ON responses(query_id);
 CREATE INDEX IF NOT EXISTS idx_responses_engine ON responses(llm_engine);
+-- Covering index for resume: completed (query, engine) pairs of a run without touching rows
+CREATE INDEX IF NOT EXISTS idx_responses_run_engine ON responses(run_id, llm_engine, model_name, query_id);
 
 CREATE TABLE IF NOT EXISTS mentions (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,6 +63,7 @@ CREATE TABLE IF NOT EXISTS mentions (
 CREATE INDEX IF NOT EXISTS idx_mentions_brand ON mentions(brand);
 CREATE INDEX IF NOT EXISTS idx_mentions_run ON mentions(run_id);
 CREATE INDEX IF NOT EXISTS idx_mentions_query ON mentions(query_id);
+CREATE INDEX IF NOT EXISTS idx_mentions_response ON mentions(response_id);
 
 CREATE TABLE IF NOT EXISTS citations (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -79,6 +83,7 @@ CREATE TABLE IF NOT EXISTS citations (
 CREATE INDEX IF NOT EXISTS idx_citations_domain ON citations(url_domain);
 CREATE INDEX IF NOT EXISTS idx_citations_brand ON citations(brand_association);
 CREATE INDEX IF NOT EXISTS idx_citations_run ON citations(run_id);
+CREATE INDEX IF NOT EXISTS idx_citations_response ON citations(response_id);
 
 CREATE TABLE IF NOT EXISTS daily_metrics (
     id                  INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -106,3 +111,63 @@ CREATE INDEX IF NOT EXISTS idx_daily_date ON daily_metrics(run_date);
 CREATE INDEX IF NOT EXISTS idx_daily_brand ON daily_metrics(brand);
 CREATE INDEX IF NOT EXISTS idx_daily_category ON daily_metrics(query_category);
 CREATE INDEX IF NOT EXISTS idx_daily_engine ON daily_metrics(llm_engine);
+-- Dashboard per-run aggregates: WHERE run_id = ? AND llm_engine = ? GROUP BY brand
+CREATE INDEX IF NOT EXISTS idx_dm_run_engine_brand ON daily_metrics(run_id, llm_engine, brand);
+-- Covering index for TrendAnalyzer: engine + date range seek, aggregates read from the index
+CREATE INDEX IF NOT EXISTS idx_dm_engine_date ON daily_metrics(
+    llm_engine, run_date, brand,
+    is_mentioned, first_mention_position, avg_sentiment_score, is_winner,
+    citation_count, www_citation_count, event_citation_count
+);
+
+CREATE TABLE IF NOT EXISTS parsed_response_cache (
+    hash            TEXT PRIMARY KEY,
+    parsed_json     TEXT NOT NULL,
+    created_at      TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key       TEXT PRIMARY KEY,
+    llm_engine      TEXT NOT NULL,
+    query_text      TEXT NOT NULL,
+    model_name      TEXT NOT NULL,
+    raw_response    TEXT NOT NULL,
+    citations_json  TEXT,
+    usage_json      TEXT,
+    created_at      TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- Per-run SOV/win-rate aggregates, written once when a run completes
+CREATE TABLE IF NOT EXISTS run_summary (
+    run_id          INTEGER NOT NULL REFERENCES benchmark_runs(id),
+    llm_engine      TEXT NOT NULL,
+    brand           TEXT NOT NULL,
+    sov             REAL,
+    avg_position    REAL,
+    avg_sentiment   REAL,
+    win_rate        REAL,
+    PRIMARY KEY (run_id, llm_engine, brand)
+);
+
+-- Generated PDFs in reports/output, so the Reports page lists them without scanning the directory
+CREATE TABLE IF NOT EXISTS reports_index (
+    filename        TEXT PRIMARY KEY,
+    run_id          INTEGER REFERENCES benchmark_runs(id),
+    size_bytes      INTEGER NOT NULL,
+    created_at      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_created ON reports_index(created_at DESC);
+
+-- Claude recommendations per run, reused until the run's metrics are recomputed or the model changes
+CREATE TABLE IF NOT EXISTS recommendations_cache (
+    run_id          INTEGER PRIMARY KEY REFERENCES benchmark_runs(id),
+    completed_at    TEXT,
+    model_name      TEXT NOT NULL,
+    recommendations_json TEXT NOT NULL,
+    created_at      TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key             TEXT PRIMARY KEY,
+    value           TEXT NOT NULL
+);
@@ -5,74 +5,64 @@ st.set_page_config(page_title="Search Terms", layout="wide")
 from auth import check_password
 if not check_password():
     st.stop()
-import pandas as pd
-from db.database import DatabaseManager
+from db._singleton import get_db
+from config.brands import BRAND_DISPLAY
+from db.cached import search_term_breakdown, refresh_button
 st.header("Search Term Analysis")
 
-db = DatabaseManager()
+db = get_db()
 engine = st.session_state.get("selected_engine", "grok_web_search")
 latest = db.get_latest_run_id()
+refresh_button()
 
 if not latest:
     st.warning("No benchmark data yet.")
     st.stop()
 
-breakdown = db.get_search_term_breakdown(latest, engine)
-if not breakdown:
+df = search_term_breakdown(latest, engine)
+if df.empty:
     st.warning("No data for selected engine.")
     st.stop()
 
-df = pd.DataFrame(breakdown)
-
 # Pivot to show one row per query with columns per brand
 categories = sorted(df["category"].unique())
 selected_cat = st.selectbox("Filter by Category", ["All"] + categories)
 if selected_cat != "All":
     df = df[df["category"] == selected_cat]
 
-# Build comparison table
-rows = []
-for qid in df["query_id"].unique():
-    q_data = df[df["query_id"] == qid]
-    query_text = q_data.iloc[0]["query_text"]
-    category = q_data.iloc[0]["category"]
-
-    row = {"Query": query_text, "Category": category}
-    winner = None
-
-    for _, r in q_data.iterrows():
-        brand = r["brand"]
-        name = {"on24": "ON24", "goldcast": "Goldcast", "zoom": "Zoom"}.get(brand, brand)
-        pos_val = r['first_mention_position']
-        pos = f"#{int(pos_val)}" if pos_val and not pd.isna(pos_val) else "-"
-        row[f"{name} Position"] = pos
-        sent_val = r['avg_sentiment_score']
-        row[f"{name} Sentiment"] = f"{sent_val:.2f}" if sent_val is not None and not pd.isna(sent_val) else "-"
-        if r["is_winner"]:
-            winner = name
-
-    row["Winner"] = winner or "None"
-    rows.append(row)
+# Build comparison table: format per-row, then one pivot instead of a loop per query
+pos = df["first_mention_position"]
+sent = df["avg_sentiment_score"]
+df = df.assign(
+    name=df["brand"].map(BRAND_DISPLAY),
+    Position=("#" + pos.fillna(0).astype(int).astype(str)).where(pos.fillna(0) != 0, "-"),
+    Sentiment=sent.map("{:.2f}".format, na_action="ignore").where(sent.notna(), "-"),
+)
 
-result_df = pd.DataFrame(rows)
+pivot = df.pivot_table(
+    index=["query_id", "query_text", "category"], columns="name",
+    values=["Position", "Sentiment"], aggfunc="first",
+).swaplevel(axis=1).sort_index(axis=1)
+pivot.columns = [f"{name} {field}" for name, field in pivot.columns]
+pivot = pivot.reset_index()
 
-# Color the winner column
-def highlight_winner(val):
-    if val == "ON24":
-        return "background-color: #BBDEFB"
-    elif val == "Goldcast":
-        return "background-color: #FFF9C4"
-    elif val == "Zoom":
-        return "background-color: #C8E6C9"
-    return ""
+winners = df.loc[df["is_winner"] == 1].groupby("query_id")["name"].last()
+pivot["Winner"] = pivot["query_id"].map(winners).fillna("None")
+result_df = pivot.drop(columns="query_id").rename(columns={"query_text": "Query", "category": "Category"})
 
-styled = result_df.style.map(highlight_winner, subset=["Winner"])
+# Color the winner column with one column-wise lookup instead of a call per cell
+WINNER_STYLES = {
+    "ON24": "background-color: #BBDEFB",
+    "Goldcast": "background-color: #FFF9C4",
+    "Zoom": "background-color: #C8E6C9",
+}
+styled = result_df.style.apply(lambda col: col.map(WINNER_STYLES).fillna(""), subset=["Winner"])
 st.dataframe(styled, use_container_width=True, hide_index=True, height=700)
 
 # Summary stats
 st.subheader("Win Summary")
-if rows:
-    wins = pd.DataFrame(rows)["Winner"].value_counts()
+if not result_df.empty:
+    wins = result_df["Winner"].value_counts()
     cols = st.columns(4)
     for i, (brand, count) in enumerate(wins.items()):
         if i < 4:
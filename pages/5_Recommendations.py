@@ -5,11 +5,11 @@ st.set_page_config(page_title="Recommendations", layout="wide")
 from auth import check_password
 if not check_password():
     st.stop()
-from db.database import DatabaseManager
+from db._singleton import get_db
 from analysis.recommendations import RecommendationEngine
 st.header("AI-Powered GEO Recommendations")
 
-db = DatabaseManager()
+db = get_db()
 latest = db.get_latest_run_id()
 
 if not latest:
@@ -5,12 +5,13 @@ st.set_page_config(page_title="Run Benchmark", layout="wide")
 from auth import check_password
 if not check_password():
     st.stop()
-from db.database import DatabaseManager
+from db._singleton import get_db
 from benchmark.engine import BenchmarkEngine
+from reports.pdf_report import materialize_in_background
 
 st.header("Run Benchmark")
 
-db = DatabaseManager()
+db = get_db()
 
 # Show past runs
 st.subheader("Benchmark History")
@@ -60,6 +61,8 @@ if stuck_runs:
             with st.spinner(f"Resuming run #{latest_stuck['id']}..."):
                 try:
                     run_id = engine.run(progress_callback=update_progress, run_id=latest_stuck["id"])
+                    st.cache_data.clear()
+                    materialize_in_background(run_id, db)
                     progress_bar.progress(1.0)
                     status_text.text("Complete!")
                     st.success(f"Benchmark completed! Run ID: #{run_id}")
@@ -105,6 +108,8 @@ if st.button("Start Benchmark Run"):
     with st.spinner("Running benchmark..."):
         try:
             run_id = engine.run(progress_callback=update_progress)
+            st.cache_data.clear()  # dashboard pages cache query results per run
+            materialize_in_background(run_id, db)  # Reports page then skips the slow aggregation + LLM step
             progress_bar.progress(1.0)
             status_text.text("Complete!")
             st.success(f"Benchmark completed! Run ID: #{run_id}")
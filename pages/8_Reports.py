@@ -1,4 +1,9 @@
+import functools
+import hashlib
 import os
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 
 st.set_page_config(page_title="Reports", layout="wide")
@@ -6,80 +11,137 @@ st.set_page_config(page_title="Reports", layout="wide")
 from auth import check_password
 if not check_password():
     st.stop()
-from db.database import DatabaseManager
-from reports.pdf_report import GEOReportGenerator
+from db._singleton import get_db
+from db.cached import completed_runs
+from reports.pdf_report import GEOReportGenerator, REPORTS_DIR, artifacts_path, report_path
 st.header("Generate PDF Report")
 
-db = DatabaseManager()
-latest = db.get_latest_run_id()
+runs = completed_runs()
 
-if not latest:
+if not runs:
     st.warning("No completed benchmark data yet. Run a benchmark first.")
     st.stop()
 
-# Show available runs
-runs = db.get_all_runs()
-completed_runs = [r for r in runs if r["status"] == "completed"]
-
-if not completed_runs:
-    st.warning("No completed benchmark runs found.")
-    st.stop()
-
-run_options = {r["id"]: f"Run #{r['id']} — {r['run_date']} ({r['total_queries']} queries)" for r in completed_runs}
+run_options = {
+    r["id"]: f"Run #{r['id']} — {r['run_date']} ({r['total_queries']} queries)"
+             + (" (precomputed)" if os.path.exists(artifacts_path(r["id"])) else "")
+    for r in runs
+}
 selected_run = st.selectbox("Select Benchmark Run", list(run_options.keys()),
                             format_func=lambda x: run_options[x])
 
 st.markdown("---")
 
-if st.button("Generate PDF Report", type="primary"):
-    with st.spinner("Generating report with charts, tables, and AI recommendations... This may take 30-60 seconds."):
-        try:
-            gen = GEOReportGenerator(db)
-            output_path = gen.generate(run_id=selected_run)
-
-            st.success(f"Report generated successfully!")
-
-            with open(output_path, "rb") as f:
-                pdf_bytes = f.read()
-
-            filename = os.path.basename(output_path)
-            st.download_button(
-                label="Download PDF Report",
-                data=pdf_bytes,
-                file_name=filename,
-                mime="application/pdf",
-                type="primary",
-            )
-
-            st.info(f"File saved to: `{output_path}`")
-
-        except Exception as e:
-            st.error(f"Error generating report: {e}")
-            import traceback
-            st.code(traceback.format_exc())
-
-# Show existing reports
-reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "output")
-if os.path.exists(reports_dir):
-    existing = sorted(
-        [f for f in os.listdir(reports_dir) if f.endswith(".pdf")],
-        reverse=True,
+
+def build_pdf(run_id, progress_cb=None):
+    """Generate the report for a run; the page only offers this when the run's PDF is missing, or to rebuild it."""
+    return GEOReportGenerator(get_db()).generate(run_id=run_id, progress_cb=progress_cb)
+
+
+@st.cache_resource
+def report_executor():
+    """Background workers shared by all sessions, so a 30-60s build never holds up a script run."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-report")
+
+
+@st.fragment(run_every=2)
+def pdf_job_status():
+    """Poll the running build, listing its progress messages; rerun the page once it finishes."""
+    job = st.session_state["pdf_job"]
+    while not job["progress"].empty():
+        job["log"].append(job["progress"].get_nowait())
+    if not job["future"].done():
+        with st.status("Generating report... This may take 30-60 seconds.", expanded=True):
+            for message in job["log"]:
+                st.write(message)
+        return
+
+    del st.session_state["pdf_job"]
+    try:
+        st.session_state["pdf_result"] = job["future"].result()
+    except Exception:
+        st.session_state["pdf_error"] = traceback.format_exc()
+    st.rerun()
+
+
+REPORTS_PAGE_SIZE = 10
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def pdf_download_button(path, label="Download PDF Report", key_prefix="dl", **kwargs):
+    """Download button for the PDF at path, keyed on a hash of its file name."""
+    fname = os.path.basename(path)
+    # A callable is only run when the button is clicked, so listing reports reads no PDFs
+    st.download_button(
+        label=label,
+        data=functools.partial(_read_bytes, path),
+        file_name=fname,
+        mime="application/pdf",
+        key=f"{key_prefix}_{hashlib.md5(fname.encode()).hexdigest()[:8]}",
+        **kwargs,
     )
-    if existing:
-        st.markdown("---")
-        st.subheader("Previous Reports")
-        for fname in existing:
-            fpath = os.path.join(reports_dir, fname)
-            size_kb = os.path.getsize(fpath) / 1024
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.text(f"{fname}  ({size_kb:.0f} KB)")
-            with col2:
-                with open(fpath, "rb") as f:
-                    st.download_button(
-                        label="Download",
-                        data=f.read(),
-                        file_name=fname,
-                        mime="application/pdf",
-                        key=fname,
-                    )
+
+
+# Scheduled runs build their PDF up front; the button here is only for runs without one, or a rebuild
+prebuilt_path = report_path(selected_run, next(r["run_date"] for r in runs if r["id"] == selected_run))
+building = "pdf_job" in st.session_state
+if os.path.exists(prebuilt_path):
+    generate = False
+    rebuild = st.button("Rebuild PDF", help="Build a fresh report, replacing the existing file", disabled=building)
+else:
+    generate = st.button("Generate PDF Report", type="primary", disabled=building)
+    rebuild = False
+
+if (generate or rebuild) and not building:
+    progress = queue.Queue()
+    st.session_state["pdf_job"] = {
+        "future": report_executor().submit(build_pdf, selected_run, progress.put),
+        "progress": progress,
+        "log": [],
+    }
+    building = True
+
+if building:
+    pdf_job_status()
+elif "pdf_error" in st.session_state:
+    st.error("Error generating report")
+    st.code(st.session_state.pop("pdf_error"))
+
+if not building and os.path.exists(prebuilt_path):
+    if "pdf_result" in st.session_state:
+        st.success("Report generated successfully!")
+        st.info(f"File saved to: `{st.session_state.pop('pdf_result')}`")
+    pdf_download_button(prebuilt_path, key_prefix="dl_selected", type="primary")
+
+
+@st.fragment
+def previous_reports(report_count):
+    """One page of download buttons at a time, read from reports_index; paging reruns only this block."""
+    st.subheader("Previous Reports")
+    page_count = (report_count + REPORTS_PAGE_SIZE - 1) // REPORTS_PAGE_SIZE
+    if page_count > 1:
+        st.number_input(
+            "Page", min_value=1, max_value=page_count, step=1, key="reports_page",
+        )
+        st.caption(f"{report_count} reports, {REPORTS_PAGE_SIZE} per page")
+    page = min(st.session_state.get("reports_page", 1), page_count)
+    for report in get_db().list_reports(limit=REPORTS_PAGE_SIZE, offset=(page - 1) * REPORTS_PAGE_SIZE):
+        fpath = os.path.join(REPORTS_DIR, report["filename"])
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.text(f"{report['filename']}  ({report['size_bytes'] / 1024:.0f} KB)")
+        with col2:
+            if os.path.exists(fpath):
+                pdf_download_button(fpath, label="Download")
+            else:
+                st.caption("File missing")
+
+
+report_count = get_db().count_reports()
+if report_count:
+    st.markdown("---")
+    previous_reports(report_count)
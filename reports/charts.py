@@ -0,0 +1,109 @@
+"""
+Matplotlib charts for the PDF report, rendered in the report's chart worker processes.
+Matplotlib is imported on the first render (or warm_up), so the report process can import
+this module for the function references alone.
+"""
+
+import io
+
+import numpy as np
+
+# PNG output is quantized to this many palette colors: the charts use a handful of flat colors plus
+# antialiasing, and fewer distinct pixels deflate far better once reportlab re-encodes the image
+PNG_COLORS = 64
+
+# Each worker process draws every chart into one Figure, reused chart to chart
+_fig = None
+
+
+def render(name, size, args, fmt, dpi):
+    """Draw chart `name` on a (width, height) inch figure and return it encoded as PNG or SVG bytes."""
+    global _fig
+    if _fig is None:
+        _fig = _new_figure()
+    _fig.clf()
+    _fig.set_size_inches(*size)
+    DRAWERS[name](_fig, _fig.add_subplot(), *args)
+    with io.BytesIO() as buf:
+        _fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches="tight",
+                     facecolor="white", edgecolor="none")
+        chart = buf.getvalue()
+    _fig.clf()  # drop the artists now rather than when the next chart is drawn
+    return _quantize_png(chart) if fmt == "png" else chart
+
+
+def _quantize_png(png):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as im, io.BytesIO() as buf:
+        im.convert("RGB").quantize(colors=PNG_COLORS, method=Image.Quantize.MEDIANCUT).save(
+            buf, format="PNG", optimize=True)
+        return buf.getvalue()
+
+
+def _new_figure():
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    return Figure()
+
+
+def warm_up():
+    """Submitted first so a worker starts and imports matplotlib before the first chart is needed."""
+    global _fig
+    if _fig is None:
+        _fig = _new_figure()
+
+
+def draw_sentiment(fig, ax, engine_labels, brands, sentiment):
+    """Horizontal bars of avg sentiment; brands is [(label, color)], sentiment[brand][engine]."""
+    y = np.arange(len(engine_labels))
+    height = 0.22
+
+    for i, ((label, color), vals) in enumerate(zip(brands, sentiment)):
+        bars = ax.barh(y + i * height, vals, height, label=label,
+                       color=color, edgecolor="white", linewidth=0.5)
+        for bar, val in zip(bars, vals):
+            offset = 0.02 if val >= 0 else -0.02
+            ha = "left" if val >= 0 else "right"
+            ax.text(val + offset, bar.get_y() + bar.get_height() / 2,
+                    f"{val:.2f}", ha=ha, va="center", fontsize=8, fontweight="bold")
+
+    ax.set_xlabel("Avg Sentiment Score (-1.0 to 1.0)", fontsize=10)
+    ax.set_title("Sentiment Analysis by LLM Engine", fontsize=13, fontweight="bold", pad=12)
+    ax.set_yticks(y + height)
+    ax.set_yticklabels(engine_labels, fontsize=9)
+    ax.axvline(x=0, color="gray", linewidth=0.5, linestyle="--")
+    ax.set_xlim(-1.0, 1.0)
+    ax.legend(fontsize=9, loc="lower right")
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.grid(axis="x", alpha=0.3)
+    fig.tight_layout()
+
+
+def draw_category_heatmap(fig, ax, category_labels, engine_labels, matrix):
+    """ON24 SOV heatmap; matrix[category][engine] in percent."""
+    im = ax.imshow(matrix, cmap="Blues", aspect="auto", vmin=0, vmax=100)
+
+    ax.set_xticks(np.arange(len(engine_labels)))
+    ax.set_xticklabels(engine_labels, fontsize=9)
+    ax.set_yticks(np.arange(len(category_labels)))
+    ax.set_yticklabels(category_labels, fontsize=9)
+
+    for i in range(len(category_labels)):
+        for j in range(len(engine_labels)):
+            val = matrix[i, j]
+            text_color = "white" if val > 60 else "black"
+            ax.text(j, i, f"{val:.0f}%", ha="center", va="center",
+                    fontsize=10, fontweight="bold", color=text_color)
+
+    ax.set_title("ON24 Share of Voice by Category & Engine", fontsize=13, fontweight="bold", pad=12)
+    fig.colorbar(im, ax=ax, label="SOV %", shrink=0.8)
+    fig.tight_layout()
+
+
+DRAWERS = {
+    "sentiment": draw_sentiment,
+    "category_heatmap": draw_category_heatmap,
+}
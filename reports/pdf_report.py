@@ -1,20 +1,21 @@
 """
 Professional PDF report generator for ON24 GEO Benchmark results.
-Uses reportlab for PDF layout and matplotlib for charts.
+Uses reportlab for PDF layout and charts; sentiment and heatmap charts come from matplotlib (reports.charts).
 """
 
+import copy
+import hashlib
 import io
+import multiprocessing
 import os
 import json
+import pickle
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from itertools import groupby
-from operator import itemgetter
+from functools import lru_cache
 
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 import numpy as np
 
 from reportlab.lib import colors
@@ -23,14 +24,18 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle,
     Image, PageBreak, HRFlowable, KeepTogether,
 )
-from reportlab.graphics.shapes import Drawing, Rect, String
+from reportlab.graphics.shapes import Drawing, Group, Rect, String
 from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics import renderPDF
 
+from reports.charts import render as render_matplotlib_chart, warm_up as warm_up_chart_worker
+
+from config.brands import BRAND_DISPLAY
 from db.database import DatabaseManager
 from analysis.recommendations import RecommendationEngine
 
@@ -41,7 +46,6 @@ BRAND_COLORS = {
     "goldcast": "#E8712B",
     "zoom": "#2D8CFF",
 }
-BRAND_DISPLAY = {"on24": "ON24", "goldcast": "Goldcast", "zoom": "Zoom"}
 ENGINE_DISPLAY = {
     "grok_web_search": "Grok (Web Search)",
     "chatgpt_web_search": "ChatGPT (Web Search)",
@@ -55,6 +59,15 @@ CATEGORY_DISPLAY = {
     "technical": "Technical",
 }
 
+# Citation table rows: get_citation_summary() bucket and its label
+CITATION_BUCKETS = (
+    ("on24_www", "ON24 (www.on24.com)"),
+    ("on24_event", "ON24 (event.on24.com)"),
+    ("goldcast", "Goldcast"),
+    ("zoom", "Zoom"),
+    ("other", "Other"),
+)
+
 # ── Color palette ─────────────────────────────────────────────
 ON24_BLUE = colors.HexColor("#0066CC")
 ON24_DARK = colors.HexColor("#003366")
@@ -66,75 +79,245 @@ DARK_GRAY = colors.HexColor("#333333")
 GREEN = colors.HexColor("#27AE60")
 RED = colors.HexColor("#E74C3C")
 AMBER = colors.HexColor("#F39C12")
+ON24_LIGHT_BLUE = colors.HexColor("#66AAEE")
+SMALL_GRAY = colors.HexColor("#888888")
+MUTED_GRAY = colors.HexColor("#555555")
+FOOTER_GRAY = colors.HexColor("#AAAAAA")
+GRID_GRAY = colors.HexColor("#E5E5E5")
+# Markup colors for the HIGH/MEDIUM/LOW impact and threat tags in the recommendations section
+LEVEL_COLORS = {"HIGH": "#E74C3C", "MEDIUM": "#F39C12", "LOW": "#27AE60"}
+# BRAND_COLORS parsed once for the reportlab charts
+BRAND_FILLS = {brand: colors.HexColor(hex_color) for brand, hex_color in BRAND_COLORS.items()}
+
+GLOSSARY = {
+    "GEO (Generative Engine Optimization)":
+        "The practice of optimizing a brand's content and online presence to appear favorably in "
+        "AI-generated search results. The AI equivalent of SEO.",
+    "Share of Voice (SOV)":
+        "The percentage of queries where a brand is mentioned at all in the LLM response. Higher is better.",
+    "Mention Position":
+        "The ordinal position where a brand first appears in an LLM response. Position #1 means "
+        "the brand is mentioned first. Lower is better.",
+    "Win Rate":
+        "The percentage of queries where a brand is determined to be the top recommendation, "
+        "based on primary recommendation status, mention position, and sentiment score.",
+    "Sentiment Score":
+        "A measure of how positively or negatively a brand is described. "
+        "Ranges from -1.0 (very negative) to +1.0 (very positive).",
+    "Primary Recommendation":
+        "When an LLM explicitly recommends one brand as the top/best choice for the query.",
+    "Citation":
+        "A URL referenced by an LLM in its response. Grok and ChatGPT include citations with web search.",
+    "Parametric Knowledge":
+        "What an LLM knows from its training data, without accessing the web.",
+    "Web Search (Live)":
+        "When an LLM searches the internet in real-time to answer a query.",
+}
+
+# BulletItem paragraphs take their bullet as bulletText rather than an inline <bullet> tag to parse
+BULLET = "\u2022"
+
+# Header row, grid and banded rows shared by the citation, category and search-term tables
+TABLE_BASE_CMDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), ON24_DARK),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.5, MED_GRAY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+]
+# Plain-string cells in SmallText's size and color, with a bold header row
+SMALL_TEXT_CMDS = [
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("LEADING", (0, 0), (-1, -1), 10),
+    ("TEXTCOLOR", (0, 1), (-1, -1), SMALL_GRAY),
+]
+REPORT_TABLE_STYLE = TableStyle(TABLE_BASE_CMDS + SMALL_TEXT_CMDS)
+SEARCH_TERM_TABLE_STYLE = TableStyle(TABLE_BASE_CMDS + SMALL_TEXT_CMDS + [
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+])
+CATEGORY_TABLE_STYLE = TableStyle(TABLE_BASE_CMDS + SMALL_TEXT_CMDS + [
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+])
+
+# Threads drawing the six report charts at once
+CHART_WORKERS = 4
+
+# Processes rendering the matplotlib charts; savefig holds the GIL, so the chart threads hand it off
+CHART_PROCESSES = 2
+
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "output")
+
+# Rendered matplotlib charts, keyed by the data they plot; bump the version when chart styling changes.
+# Stored as SVG and embedded as vector Drawings when svglib is installed, otherwise as PNG
+CHART_CACHE_DIR = os.path.join(REPORTS_DIR, ".chartcache")
+CHART_CACHE_MAX = 200
+CHART_CACHE_VERSION = 3
+
+# PNG fallback resolution; reportlab decodes and re-deflates every PNG pixel, so this sets the compression cost
+CHART_DPI = 110
+
+# Bump when the shape of the pickled report data changes so older artifacts are recomputed
+ARTIFACTS_VERSION = 3
+
+
+def report_path(run_id, run_date):
+    """Default PDF location for a run; generate() writes here unless given output_path.
+
+    The run id keeps two runs on the same date from overwriting each other's report.
+    """
+    return os.path.join(REPORTS_DIR, f"ON24_GEO_Report_{run_date}_run{run_id}.pdf")
+
+
+def _chart_cache_path(name, key_data):
+    """Content-addressed cache file for a matplotlib chart; SVG when svglib can embed it, else PNG."""
+    fmt = "svg" if _svg2rlg() else "png"
+    key = hashlib.blake2b(json.dumps([CHART_CACHE_VERSION, name, key_data], sort_keys=True, default=str).encode(),
+                          digest_size=16).hexdigest()
+    return os.path.join(CHART_CACHE_DIR, f"{key}.{fmt}")
+
+
+def _prune_chart_cache():
+    """Delete all but the CHART_CACHE_MAX most recently used chart files."""
+    try:
+        with os.scandir(CHART_CACHE_DIR) as entries:
+            charts = sorted((e for e in entries if e.name.endswith((".png", ".svg"))),
+                            key=lambda e: e.stat().st_mtime, reverse=True)
+        for entry in charts[CHART_CACHE_MAX:]:
+            os.remove(entry.path)
+    except OSError:
+        pass  # another generator pruned the same files
+
+
+def artifacts_path(run_id):
+    """Where materialize() pickles a run's aggregates and recommendations."""
+    return os.path.join(REPORTS_DIR, str(run_id), "artifacts", "report_data.pkl")
+
+
+class _ReportDocTemplate(BaseDocTemplate):
+    """Letter pages with one body frame; every page gets the same header/footer in a single layout pass.
+
+    Page streams are always Flate-compressed, whatever a site reportlab_settings.py says.
+    """
+    def __init__(self, filename, on_page):
+        super().__init__(
+            filename, pagesize=letter, pageCompression=1,
+            topMargin=0.6 * inch, bottomMargin=0.5 * inch,
+            leftMargin=0.6 * inch, rightMargin=0.6 * inch,
+        )
+        self.generated_label = f"Generated {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id="body")
+        self.addPageTemplates([PageTemplate(id="page", frames=[frame], onPage=on_page)])
 
 
 class GEOReportGenerator:
+    _styles_cache = None
+    _glossary_cache = None
+
     def __init__(self, db: DatabaseManager = None):
         self.db = db or DatabaseManager()
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
+        self.styles = self._stylesheet()
+
+    @classmethod
+    def _stylesheet(cls):
+        """Sample stylesheet plus the report styles, built on first use and shared read-only by every instance."""
+        if cls._styles_cache is None:
+            styles = getSampleStyleSheet()
+            cls._setup_styles(styles)
+            cls._styles_cache = styles
+        return cls._styles_cache
+
+    @classmethod
+    def _glossary_flowables(cls):
+        """Term/definition paragraphs for the static glossary, parsed once and copied into each report."""
+        if cls._glossary_cache is None:
+            styles = cls._stylesheet()
+            flowables = []
+            for term, defn in GLOSSARY.items():
+                flowables.append(Paragraph(f"<b>{term}</b>", styles["BodyText"]))
+                flowables.append(Paragraph(defn, styles["GlossaryDef"]))
+            cls._glossary_cache = flowables
+        return cls._glossary_cache
 
-    def _setup_styles(self):
+    @staticmethod
+    def _setup_styles(styles):
         """Add custom paragraph styles for the report."""
-        self.styles.add(ParagraphStyle(
-            "ReportTitle", parent=self.styles["Title"],
+        styles.add(ParagraphStyle(
+            "ReportTitle", parent=styles["Title"],
             fontSize=28, textColor=ON24_DARK, spaceAfter=6,
             alignment=TA_CENTER, fontName="Helvetica-Bold",
         ))
-        self.styles.add(ParagraphStyle(
-            "ReportSubtitle", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "ReportSubtitle", parent=styles["Normal"],
             fontSize=14, textColor=colors.HexColor("#666666"),
             spaceAfter=20, alignment=TA_CENTER,
         ))
-        self.styles.add(ParagraphStyle(
-            "SectionHeader", parent=self.styles["Heading1"],
+        styles.add(ParagraphStyle(
+            "SectionHeader", parent=styles["Heading1"],
             fontSize=20, textColor=ON24_DARK, spaceBefore=18,
             spaceAfter=10, fontName="Helvetica-Bold",
             borderWidth=0, borderPadding=0,
         ))
-        self.styles.add(ParagraphStyle(
-            "SubHeader", parent=self.styles["Heading2"],
+        styles.add(ParagraphStyle(
+            "SubHeader", parent=styles["Heading2"],
             fontSize=14, textColor=ON24_BLUE, spaceBefore=12,
             spaceAfter=6, fontName="Helvetica-Bold",
         ))
         # Modify existing BodyText style (built-in)
-        self.styles["BodyText"].fontSize = 10
-        self.styles["BodyText"].leading = 14
-        self.styles["BodyText"].spaceAfter = 8
-        self.styles["BodyText"].alignment = TA_JUSTIFY
-        self.styles["BodyText"].textColor = DARK_GRAY
-        self.styles.add(ParagraphStyle(
-            "SmallText", parent=self.styles["Normal"],
-            fontSize=8, leading=10, textColor=colors.HexColor("#888888"),
+        styles["BodyText"].fontSize = 10
+        styles["BodyText"].leading = 14
+        styles["BodyText"].spaceAfter = 8
+        styles["BodyText"].alignment = TA_JUSTIFY
+        styles["BodyText"].textColor = DARK_GRAY
+        styles.add(ParagraphStyle(
+            "SmallText", parent=styles["Normal"],
+            fontSize=8, leading=10, textColor=SMALL_GRAY,
         ))
-        self.styles.add(ParagraphStyle(
-            "KPILabel", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "KPILabel", parent=styles["Normal"],
             fontSize=9, textColor=colors.HexColor("#666666"),
             alignment=TA_CENTER,
         ))
-        self.styles.add(ParagraphStyle(
-            "KPIValue", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "KPIValue", parent=styles["Normal"],
             fontSize=22, fontName="Helvetica-Bold",
             textColor=ON24_DARK, alignment=TA_CENTER, spaceAfter=2,
         ))
-        self.styles.add(ParagraphStyle(
-            "Winner", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "Winner", parent=styles["Normal"],
             fontSize=10, textColor=GREEN, fontName="Helvetica-Bold",
         ))
-        self.styles.add(ParagraphStyle(
-            "Loser", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "Loser", parent=styles["Normal"],
             fontSize=10, textColor=RED, fontName="Helvetica-Bold",
         ))
-        self.styles.add(ParagraphStyle(
-            "BulletItem", parent=self.styles["Normal"],
+        styles.add(ParagraphStyle(
+            "BulletItem", parent=styles["Normal"],
             fontSize=10, leading=14, leftIndent=20, spaceBefore=2,
             spaceAfter=2, bulletIndent=8, textColor=DARK_GRAY,
         ))
-        self.styles.add(ParagraphStyle(
-            "FooterStyle", parent=self.styles["Normal"],
-            fontSize=8, textColor=colors.HexColor("#AAAAAA"),
+        styles.add(ParagraphStyle(
+            "FooterStyle", parent=styles["Normal"],
+            fontSize=8, textColor=FOOTER_GRAY,
             alignment=TA_CENTER,
         ))
+        styles.add(ParagraphStyle(
+            "TOCEntry", parent=styles["BodyText"],
+            fontSize=11, spaceBefore=4, spaceAfter=4, leftIndent=20,
+        ))
+        styles.add(ParagraphStyle(
+            "RecRationale", parent=styles["BodyText"],
+            leftIndent=20, textColor=MUTED_GRAY,
+        ))
+        styles.add(ParagraphStyle(
+            "GlossaryDef", parent=styles["BodyText"],
+            leftIndent=20, spaceBefore=0, spaceAfter=8, textColor=MUTED_GRAY,
+        ))
 
     # ── Data loading ──────────────────────────────────────────
     def _load_data(self, run_id=None):
@@ -144,311 +327,280 @@ class GEOReportGenerator:
         if not run_id:
             raise ValueError("No completed benchmark run found.")
 
+        # completed_at changes whenever the run's metrics are recomputed
         run = self.db.get_run(run_id)
-        metrics = self.db.get_daily_metrics_for_run(run_id)
-        queries = {q["id"]: q for q in self.db.get_active_queries()}
-
-        # Aggregate SOV per engine per brand
-        engines = sorted(set(m["llm_engine"] for m in metrics))
-        brands = ["on24", "goldcast", "zoom"]
-
-        sov_by_engine = {}
-        pos_by_engine = {}
-        sent_by_engine = {}
-        win_by_engine = {}
-
-        for engine in engines:
-            eng_metrics = [m for m in metrics if m["llm_engine"] == engine]
-            sov_by_engine[engine] = {}
-            pos_by_engine[engine] = {}
-            sent_by_engine[engine] = {}
-            win_by_engine[engine] = {}
-            for brand in brands:
-                bm = [m for m in eng_metrics if m["brand"] == brand]
-                if bm:
-                    sov_by_engine[engine][brand] = sum(m["is_mentioned"] for m in bm) / len(bm) * 100
-                    positions = [m["first_mention_position"] for m in bm if m["first_mention_position"]]
-                    pos_by_engine[engine][brand] = sum(positions) / len(positions) if positions else None
-                    sentiments = [m["avg_sentiment_score"] for m in bm if m["avg_sentiment_score"] is not None]
-                    sent_by_engine[engine][brand] = sum(sentiments) / len(sentiments) if sentiments else 0
-                    win_by_engine[engine][brand] = sum(m["is_winner"] for m in bm) / len(bm) * 100
-
-        # Category breakdown
-        cat_data = {}
-        for engine in engines:
-            eng_metrics = [m for m in metrics if m["llm_engine"] == engine]
-            sorted_m = sorted(eng_metrics, key=itemgetter("query_category"))
-            for cat, group in groupby(sorted_m, key=itemgetter("query_category")):
-                rows = list(group)
-                if cat not in cat_data:
-                    cat_data[cat] = {}
-                if engine not in cat_data[cat]:
-                    cat_data[cat][engine] = {}
-                for brand in brands:
-                    bm = [r for r in rows if r["brand"] == brand]
-                    if bm:
-                        cat_data[cat][engine][brand] = {
-                            "sov": sum(r["is_mentioned"] for r in bm) / len(bm) * 100,
-                            "wins": sum(r["is_winner"] for r in bm),
-                            "total": len(bm),
-                        }
-
-        # Per-query winners
-        query_winners = {}
-        for engine in engines:
-            eng_metrics = [m for m in metrics if m["llm_engine"] == engine]
-            sorted_m = sorted(eng_metrics, key=itemgetter("query_id"))
-            for qid, group in groupby(sorted_m, key=itemgetter("query_id")):
-                rows = list(group)
-                winner = next((r for r in rows if r["is_winner"]), None)
-                if qid not in query_winners:
-                    query_winners[qid] = {}
-                query_winners[qid][engine] = {
-                    "winner": winner["brand"] if winner else None,
-                    "brands": {r["brand"]: {
-                        "mentioned": r["is_mentioned"],
-                        "position": r["first_mention_position"],
-                        "sentiment": r["avg_sentiment_score"],
-                        "primary": r["is_primary_recommendation"],
-                    } for r in rows},
-                }
-
-        # Citations
-        citations = self.db.query(
-            "SELECT * FROM citations WHERE run_id = ?", (run_id,)
-        )
-        citation_summary = {"on24_www": 0, "on24_event": 0, "goldcast": 0, "zoom": 0, "other": 0}
-        for c in citations:
-            if c["is_on24_www"]:
-                citation_summary["on24_www"] += 1
-            elif c["is_on24_event"]:
-                citation_summary["on24_event"] += 1
-            elif c["brand_association"] == "goldcast":
-                citation_summary["goldcast"] += 1
-            elif c["brand_association"] == "zoom":
-                citation_summary["zoom"] += 1
-            else:
-                citation_summary["other"] += 1
-
-        return {
-            "run": run,
-            "run_id": run_id,
-            "metrics": metrics,
-            "queries": queries,
-            "engines": engines,
-            "brands": brands,
-            "sov": sov_by_engine,
-            "positions": pos_by_engine,
-            "sentiment": sent_by_engine,
-            "win_rate": win_by_engine,
-            "cat_data": cat_data,
-            "query_winners": query_winners,
-            "citations": citation_summary,
-            "total_citations": len(citations),
-        }
+        if run is None:
+            raise ValueError(f"Benchmark run #{run_id} not found.")
+        # Copy so callers can't mutate the cached aggregates
+        return copy.deepcopy(_cached_report_data(self.db.db_path, run_id, run["completed_at"]))
 
-    # ── Chart generators (matplotlib → PNG → reportlab Image) ─
-    def _make_chart_image(self, fig, width=6.5, height=3.5):
-        """Convert a matplotlib figure to a reportlab Image flowable."""
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight",
-                    facecolor="white", edgecolor="none")
-        plt.close(fig)
-        buf.seek(0)
-        img = Image(buf, width=width * inch, height=height * inch)
-        return img
+    def _recommendations(self, run_id):
+        """AI recommendations for the run, or placeholder text if they could not be generated."""
+        try:
+            return RecommendationEngine(self.db).generate_recommendations(run_id)
+        except Exception:
+            return {
+                "executive_summary": "Recommendations could not be generated.",
+                "wins": [], "losses": [], "recommendations": [],
+                "competitor_insights": {
+                    "goldcast": {"strengths": "N/A", "weaknesses": "N/A", "threat_level": "medium"},
+                    "zoom": {"strengths": "N/A", "weaknesses": "N/A", "threat_level": "medium"},
+                },
+            }
 
-    def _chart_sov_comparison(self, data):
-        """Grouped bar chart: SOV by brand across engines."""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        engines = data["engines"]
-        brands = data["brands"]
-        x = np.arange(len(engines))
-        width = 0.22
+    # ── Precomputed artifacts ─────────────────────────────────
+    def materialize(self, run_id=None) -> str:
+        """Compute a completed run's report data and recommendations once so generate() only lays out the PDF.
 
+        Returns the artifacts path. Failed recommendations are not stored, so generate() retries them.
+        """
+        data = self._load_data(run_id)
+        recs = self._recommendations(data["run_id"])
+        path = artifacts_path(data["run_id"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({
+                "version": ARTIFACTS_VERSION,
+                "completed_at": data["run"]["completed_at"],
+                "data": data,
+                "recs": recs if recs.get("recommendations") else None,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+    def _load_artifacts(self, run_id=None):
+        """(data, recs) saved by materialize(), or None if missing or the run was recomputed since."""
+        if run_id is None:
+            run_id = self.db.get_latest_run_id()
+        if not run_id:
+            return None
+        try:
+            with open(artifacts_path(run_id), "rb") as f:
+                artifacts = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if artifacts.get("version") != ARTIFACTS_VERSION:
+            return None
+        run = self.db.get_run(run_id)
+        if not run or run["completed_at"] != artifacts["completed_at"]:
+            return None
+        return artifacts["data"], artifacts["recs"]
+
+    # ── Chart generators (reportlab Drawings; matplotlib via reports.charts) ─
+    def _render_charts(self, data):
+        """Build every report chart concurrently; matplotlib cache misses are rendered in worker processes."""
+        charts = {
+            "sov": self._chart_sov_comparison,
+            "win_rate": self._chart_win_rate,
+            "position": self._chart_position,
+            "sentiment": self._chart_sentiment,
+            "citations": self._chart_citations,
+            "category": self._chart_category_heatmap,
+        }
+        with ThreadPoolExecutor(max_workers=CHART_WORKERS, thread_name_prefix="chart") as pool:
+            futures = {name: pool.submit(draw, data) for name, draw in charts.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _cached_chart_image(self, name, key_data, size, args, width=6.5, height=3.5):
+        """Flowable for a matplotlib chart, read from CHART_CACHE_DIR when key_data is unchanged.
+
+        On a miss, reports.charts draws chart `name` with args on a `size` inch figure in the
+        chart process pool. With svglib the chart is embedded as a vector Drawing
+        fitted to width x height inches, otherwise as a PNG Image. Only the newest CHART_CACHE_MAX
+        files are kept.
+        """
+        path = _chart_cache_path(name, key_data)
+        fmt = path.rsplit(".", 1)[1]
+        try:
+            with open(path, "rb") as f:
+                chart = f.read()
+            os.utime(path)  # keep recently used charts out of the prune
+        except OSError:
+            chart = _chart_process_pool().submit(render_matplotlib_chart, name, size, args, fmt, CHART_DPI).result()
+            os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(chart)
+            os.replace(tmp_path, path)
+            _prune_chart_cache()
+        if fmt == "png":
+            # Read back from the cache file when the page is drawn instead of holding the bytes in the story
+            return Image(path, width=width * inch, height=height * inch)
+
+        drawing = _svg2rlg()(io.BytesIO(chart))
+        scale = min(width * inch / drawing.width, height * inch / drawing.height)
+        drawing.scale(scale, scale)
+        drawing.width, drawing.height = drawing.width * scale, drawing.height * scale
+        drawing.hAlign = "CENTER"
+        return drawing
+
+    def _bar_drawing(self, title, data, metric, y_label, value_max, label_fmt, width=6.5, height=3.5):
+        """Native (vector) grouped bar chart of one per-(engine, brand) metric, one bar group per engine."""
+        engines, brands = data["engines"], data["brands"]
+        drawing = Drawing(width * inch, height * inch)
+        drawing.add(String(drawing.width / 2, drawing.height - 16, title, textAnchor="middle",
+                           fontName="Helvetica-Bold", fontSize=13))
+
+        bc = VerticalBarChart()
+        bc.x, bc.y = 52, 30
+        bc.width, bc.height = drawing.width - 62, drawing.height - 90
+        bc.data = [[data[metric].get(e, {}).get(b) or 0 for e in engines] for b in brands]
+        bc.groupSpacing = 12
+        bc.barSpacing = 1
+        bc.strokeColor = None
         for i, brand in enumerate(brands):
-            vals = [data["sov"].get(e, {}).get(brand, 0) for e in engines]
-            bars = ax.bar(x + i * width, vals, width, label=BRAND_DISPLAY[brand],
-                         color=BRAND_COLORS[brand], edgecolor="white", linewidth=0.5)
-            for bar, val in zip(bars, vals):
-                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 1,
-                        f"{val:.0f}%", ha="center", va="bottom", fontsize=8, fontweight="bold")
-
-        ax.set_ylabel("Share of Voice (%)", fontsize=10)
-        ax.set_title("Share of Voice by LLM Engine", fontsize=13, fontweight="bold", pad=12)
-        ax.set_xticks(x + width)
-        ax.set_xticklabels([ENGINE_DISPLAY.get(e, e) for e in engines], fontsize=9)
-        ax.set_ylim(0, 110)
-        ax.legend(fontsize=9, loc="upper right")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.grid(axis="y", alpha=0.3)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=6.5, height=3.5)
+            bc.bars[i].fillColor = BRAND_FILLS[brand]
+            bc.bars[i].strokeColor = colors.white
+        bc.barLabelFormat = label_fmt
+        bc.barLabels.nudge = 6
+        bc.barLabels.fontName = "Helvetica-Bold"
+        bc.barLabels.fontSize = 7
+        bc.categoryAxis.categoryNames = [ENGINE_DISPLAY.get(e, e) for e in engines]
+        bc.categoryAxis.labels.fontName = "Helvetica"
+        bc.categoryAxis.labels.fontSize = 8
+        bc.categoryAxis.labels.dy = -2
+        bc.valueAxis.valueMin = 0
+        bc.valueAxis.valueMax = value_max
+        bc.valueAxis.labels.fontName = "Helvetica"
+        bc.valueAxis.labels.fontSize = 8
+        bc.valueAxis.visibleGrid = True
+        bc.valueAxis.gridStrokeColor = GRID_GRAY
+        bc.valueAxis.strokeColor = MED_GRAY
+        drawing.add(bc)
+
+        axis_label = Group(String(0, 0, y_label, textAnchor="middle", fontName="Helvetica", fontSize=8))
+        axis_label.translate(14, bc.y + bc.height / 2)
+        axis_label.rotate(90)
+        drawing.add(axis_label)
+
+        # One row of swatches between the title and the plot
+        legend = Legend()
+        legend.x, legend.y = drawing.width / 2 - 110, drawing.height - 32
+        legend.fontName = "Helvetica"
+        legend.fontSize = 8
+        legend.dxTextSpace = 4
+        legend.columnMaximum = 1
+        legend.deltax = 75
+        legend.alignment = "right"  # swatch before its label
+        legend.colorNamePairs = [(BRAND_FILLS[b], BRAND_DISPLAY[b]) for b in brands]
+        drawing.add(legend)
+        return drawing
+
+    def _no_data(self):
+        """Stands in for a chart whose metric is zero or missing everywhere in the run."""
+        return Paragraph("No data available for this metric", self.styles["SmallText"])
+
+    def _chart_sov_comparison(self, data):
+        """Grouped bar chart: SOV by brand across engines."""
+        if not data["sov_mat"].any():
+            return self._no_data()
+        return self._bar_drawing("Share of Voice by LLM Engine", data, "sov",
+                                 "Share of Voice (%)", 110, "%.0f%%")
 
     def _chart_win_rate(self, data):
         """Grouped bar chart: Win Rate by brand across engines."""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        engines = data["engines"]
-        brands = data["brands"]
-        x = np.arange(len(engines))
-        width = 0.22
+        if not data["win_mat"].any():
+            return self._no_data()
+        top = max((data["win_rate"].get(e, {}).get(b, 0) for e in data["engines"] for b in data["brands"]),
+                  default=0)
+        return self._bar_drawing("Win Rate by LLM Engine", data, "win_rate",
+                                 "Win Rate (%)", max(top, 10) + 15, "%.0f%%")
 
-        for i, brand in enumerate(brands):
-            vals = [data["win_rate"].get(e, {}).get(brand, 0) for e in engines]
-            bars = ax.bar(x + i * width, vals, width, label=BRAND_DISPLAY[brand],
-                         color=BRAND_COLORS[brand], edgecolor="white", linewidth=0.5)
-            for bar, val in zip(bars, vals):
-                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 1,
-                        f"{val:.0f}%", ha="center", va="bottom", fontsize=8, fontweight="bold")
-
-        ax.set_ylabel("Win Rate (%)", fontsize=10)
-        ax.set_title("Win Rate by LLM Engine", fontsize=13, fontweight="bold", pad=12)
-        ax.set_xticks(x + width)
-        ax.set_xticklabels([ENGINE_DISPLAY.get(e, e) for e in engines], fontsize=9)
-        ax.set_ylim(0, max(max(data["win_rate"].get(e, {}).get(b, 0) for e in engines for b in brands), 10) + 15)
-        ax.legend(fontsize=9, loc="upper right")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.grid(axis="y", alpha=0.3)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=6.5, height=3.5)
+    def _matplotlib_chart_specs(self, data):
+        """_cached_chart_image() arguments for each matplotlib chart, None where the chart has no data."""
+        return [self._sentiment_spec(data), self._category_heatmap_spec(data)]
 
     def _chart_sentiment(self, data):
         """Horizontal bar chart: Average sentiment by brand across engines."""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        engines = data["engines"]
-        brands = data["brands"]
-        y = np.arange(len(engines))
-        height = 0.22
+        spec = self._sentiment_spec(data)
+        return self._cached_chart_image(*spec) if spec else self._no_data()
 
-        for i, brand in enumerate(brands):
-            vals = [data["sentiment"].get(e, {}).get(brand, 0) for e in engines]
-            bars = ax.barh(y + i * height, vals, height, label=BRAND_DISPLAY[brand],
-                          color=BRAND_COLORS[brand], edgecolor="white", linewidth=0.5)
-            for bar, val in zip(bars, vals):
-                offset = 0.02 if val >= 0 else -0.02
-                ha = "left" if val >= 0 else "right"
-                ax.text(val + offset, bar.get_y() + bar.get_height() / 2,
-                        f"{val:.2f}", ha=ha, va="center", fontsize=8, fontweight="bold")
-
-        ax.set_xlabel("Avg Sentiment Score (-1.0 to 1.0)", fontsize=10)
-        ax.set_title("Sentiment Analysis by LLM Engine", fontsize=13, fontweight="bold", pad=12)
-        ax.set_yticks(y + height)
-        ax.set_yticklabels([ENGINE_DISPLAY.get(e, e) for e in engines], fontsize=9)
-        ax.axvline(x=0, color="gray", linewidth=0.5, linestyle="--")
-        ax.set_xlim(-1.0, 1.0)
-        ax.legend(fontsize=9, loc="lower right")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.grid(axis="x", alpha=0.3)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=6.5, height=3.5)
+    @staticmethod
+    def _sentiment_spec(data):
+        if not data["sent_mat"].any():
+            return None
+        return (
+            "sentiment", [data["engines"], data["brands"], data["sentiment"]],
+            (8, 4), (
+                [ENGINE_DISPLAY.get(e, e) for e in data["engines"]],
+                [(BRAND_DISPLAY[b], BRAND_COLORS[b]) for b in data["brands"]],
+                [[data["sentiment"].get(e, {}).get(b, 0) for e in data["engines"]] for b in data["brands"]],
+            ),
+            6.5, 3.5,
+        )
 
     def _chart_position(self, data):
         """Bar chart: Average mention position (lower is better)."""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        engines = data["engines"]
-        brands = data["brands"]
-        x = np.arange(len(engines))
-        width = 0.22
-
-        for i, brand in enumerate(brands):
-            vals = [data["positions"].get(e, {}).get(brand) or 0 for e in engines]
-            bars = ax.bar(x + i * width, vals, width, label=BRAND_DISPLAY[brand],
-                         color=BRAND_COLORS[brand], edgecolor="white", linewidth=0.5)
-            for bar, val in zip(bars, vals):
-                if val > 0:
-                    ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.05,
-                            f"#{val:.1f}", ha="center", va="bottom", fontsize=8, fontweight="bold")
-
-        ax.set_ylabel("Avg Mention Position (lower = better)", fontsize=10)
-        ax.set_title("Average Mention Position by LLM Engine", fontsize=13, fontweight="bold", pad=12)
-        ax.set_xticks(x + width)
-        ax.set_xticklabels([ENGINE_DISPLAY.get(e, e) for e in engines], fontsize=9)
-        ax.invert_yaxis()
-        ax.legend(fontsize=9, loc="lower right")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.grid(axis="y", alpha=0.3)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=6.5, height=3.5)
+        if np.isnan(data["pos_mat"]).all():
+            return self._no_data()
+        top = max((data["positions"].get(e, {}).get(b) or 0 for e in data["engines"] for b in data["brands"]),
+                  default=0)
+        return self._bar_drawing("Average Mention Position by LLM Engine", data, "positions",
+                                 "Avg Mention Position (lower = better)", max(top, 1) + 0.5,
+                                 lambda v: f"#{v:.1f}" if v > 0 else "")
 
     def _chart_citations(self, data):
         """Pie chart: Citation distribution."""
-        fig, ax = plt.subplots(figsize=(5, 4))
         cs = data["citations"]
-        labels = []
-        sizes = []
-        clrs = []
-        if cs["on24_www"]:
-            labels.append("ON24 (www)")
-            sizes.append(cs["on24_www"])
-            clrs.append("#0066CC")
-        if cs["on24_event"]:
-            labels.append("ON24 (event)")
-            sizes.append(cs["on24_event"])
-            clrs.append("#66AAEE")
-        if cs["goldcast"]:
-            labels.append("Goldcast")
-            sizes.append(cs["goldcast"])
-            clrs.append("#E8712B")
-        if cs["zoom"]:
-            labels.append("Zoom")
-            sizes.append(cs["zoom"])
-            clrs.append("#2D8CFF")
-        if cs["other"]:
-            labels.append("Other")
-            sizes.append(cs["other"])
-            clrs.append("#CCCCCC")
-
-        if not sizes:
-            ax.text(0.5, 0.5, "No citations found", ha="center", va="center", fontsize=12)
-        else:
-            wedges, texts, autotexts = ax.pie(
-                sizes, labels=labels, colors=clrs, autopct="%1.0f%%",
-                startangle=90, pctdistance=0.8, textprops={"fontsize": 9},
-            )
-            for txt in autotexts:
-                txt.set_fontweight("bold")
-                txt.set_fontsize(8)
-        ax.set_title("Citation Distribution", fontsize=13, fontweight="bold", pad=12)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=4.5, height=3.5)
+        slices = [
+            (label, cs[key], color) for key, label, color in (
+                ("on24_www", "ON24 (www)", ON24_BLUE),
+                ("on24_event", "ON24 (event)", ON24_LIGHT_BLUE),
+                ("goldcast", "Goldcast", GOLD),
+                ("zoom", "Zoom", ZOOM_BLUE),
+                ("other", "Other", MED_GRAY),
+            ) if cs[key]
+        ]
+
+        drawing = Drawing(4.5 * inch, 3.5 * inch)
+        drawing.add(String(drawing.width / 2, drawing.height - 16, "Citation Distribution",
+                           textAnchor="middle", fontName="Helvetica-Bold", fontSize=13))
+        if not slices:
+            drawing.add(String(drawing.width / 2, drawing.height / 2, "No citations found",
+                               textAnchor="middle", fontName="Helvetica", fontSize=12))
+            return drawing
+
+        total = sum(size for _, size, _ in slices)
+        pie = Pie()
+        pie.width = pie.height = 150
+        pie.x, pie.y = (drawing.width - pie.width) / 2, 45
+        pie.data = [size for _, size, _ in slices]
+        pie.labels = [f"{label} {size / total * 100:.0f}%" for label, size, _ in slices]
+        pie.startAngle = 90
+        pie.direction = "anticlockwise"
+        pie.sideLabels = True
+        pie.simpleLabels = False
+        pie.slices.strokeColor = colors.white
+        pie.slices.fontName = "Helvetica"
+        pie.slices.fontSize = 8
+        for i, (_, _, color) in enumerate(slices):
+            pie.slices[i].fillColor = color
+        drawing.add(pie)
+        return drawing
 
     def _chart_category_heatmap(self, data):
         """Heatmap: ON24 SOV by category and engine."""
+        spec = self._category_heatmap_spec(data)
+        return self._cached_chart_image(*spec) if spec else self._no_data()
+
+    @staticmethod
+    def _category_heatmap_spec(data):
         categories = sorted(data["cat_data"].keys())
         engines = data["engines"]
-
-        fig, ax = plt.subplots(figsize=(8, max(3, len(categories) * 0.7 + 1)))
-        matrix = []
-        for cat in categories:
-            row = []
-            for eng in engines:
-                sov = data["cat_data"].get(cat, {}).get(eng, {}).get("on24", {}).get("sov", 0)
-                row.append(sov)
-            matrix.append(row)
-
-        matrix = np.array(matrix)
-        im = ax.imshow(matrix, cmap="Blues", aspect="auto", vmin=0, vmax=100)
-
-        ax.set_xticks(np.arange(len(engines)))
-        ax.set_xticklabels([ENGINE_DISPLAY.get(e, e) for e in engines], fontsize=9)
-        ax.set_yticks(np.arange(len(categories)))
-        ax.set_yticklabels([CATEGORY_DISPLAY.get(c, c) for c in categories], fontsize=9)
-
-        for i in range(len(categories)):
-            for j in range(len(engines)):
-                val = matrix[i, j]
-                text_color = "white" if val > 60 else "black"
-                ax.text(j, i, f"{val:.0f}%", ha="center", va="center",
-                        fontsize=10, fontweight="bold", color=text_color)
-
-        ax.set_title("ON24 Share of Voice by Category & Engine", fontsize=13, fontweight="bold", pad=12)
-        fig.colorbar(im, ax=ax, label="SOV %", shrink=0.8)
-        fig.tight_layout()
-        return self._make_chart_image(fig, width=6.5, height=max(3, len(categories) * 0.6 + 1))
+        matrix = np.array([
+            [data["cat_data"][cat].get(eng, {}).get("on24", {}).get("sov", 0) for eng in engines]
+            for cat in categories
+        ], dtype=float).reshape(len(categories), len(engines))
+        if not matrix.any():
+            return None
+        # The matrix rarely changes between runs; its raw bytes are a compact cache key
+        return (
+            "category_heatmap", [engines, categories, matrix.tobytes().hex()],
+            (8, max(3, len(categories) * 0.7 + 1)),
+            ([CATEGORY_DISPLAY.get(c, c) for c in categories], [ENGINE_DISPLAY.get(e, e) for e in engines], matrix),
+            6.5, max(3, len(categories) * 0.6 + 1),
+        )
 
     # ── Table builders ────────────────────────────────────────
     def _kpi_cards(self, data, engine):
@@ -458,10 +610,11 @@ class GEOReportGenerator:
             [Paragraph(f"<b>{BRAND_DISPLAY[b]}</b>", self.styles["KPILabel"]) for b in brands],
         ]
 
+        ei = data["engines"].index(engine)
+
         # SOV row
         sov_row = []
-        for b in brands:
-            val = data["sov"].get(engine, {}).get(b, 0)
+        for b, val in zip(brands, data["sov_mat"][ei]):
             color = "#27AE60" if b == "on24" and val > 50 else "#333333"
             sov_row.append(Paragraph(f'<font color="{color}" size="18"><b>{val:.0f}%</b></font><br/>'
                                      f'<font size="8" color="#888">Share of Voice</font>',
@@ -470,9 +623,8 @@ class GEOReportGenerator:
 
         # Position row
         pos_row = []
-        for b in brands:
-            val = data["positions"].get(engine, {}).get(b)
-            txt = f"#{val:.1f}" if val else "N/A"
+        for val in data["pos_mat"][ei]:
+            txt = f"#{val:.1f}" if val > 0 else "N/A"  # NaN compares false
             pos_row.append(Paragraph(f'<font size="18"><b>{txt}</b></font><br/>'
                                      f'<font size="8" color="#888">Avg Position</font>',
                                      self.styles["KPILabel"]))
@@ -480,8 +632,7 @@ class GEOReportGenerator:
 
         # Win rate row
         wr_row = []
-        for b in brands:
-            val = data["win_rate"].get(engine, {}).get(b, 0)
+        for val in data["win_mat"][ei]:
             wr_row.append(Paragraph(f'<font size="18"><b>{val:.0f}%</b></font><br/>'
                                     f'<font size="8" color="#888">Win Rate</font>',
                                     self.styles["KPILabel"]))
@@ -489,8 +640,7 @@ class GEOReportGenerator:
 
         # Sentiment row
         sent_row = []
-        for b in brands:
-            val = data["sentiment"].get(engine, {}).get(b, 0)
+        for val in data["sent_mat"][ei]:
             color = "#27AE60" if val > 0.3 else "#E74C3C" if val < -0.1 else "#F39C12"
             sent_row.append(Paragraph(f'<font color="{color}" size="18"><b>{val:.2f}</b></font><br/>'
                                       f'<font size="8" color="#888">Sentiment</font>',
@@ -509,28 +659,35 @@ class GEOReportGenerator:
         ]))
         return tbl
 
-    def _search_term_table(self, data, engine):
-        """Build per-query winner table for a specific engine."""
-        queries = data["queries"]
+    def _search_term_cells(self, data):
+        """Query and winner cells for the search-term tables; identical for every engine, so parsed once."""
+        small = self.styles["SmallText"]
+        queries = {}
+        for qid in data["query_winners"]:
+            q_text = data["queries"].get(qid, {}).get("query_text", f"Query {qid}")
+            # Truncate
+            if len(q_text) > 55:
+                q_text = q_text[:52] + "..."
+            queries[qid] = Paragraph(q_text, small)
+        winners = {}
+        for q_engines in data["query_winners"].values():
+            for q_data in q_engines.values():
+                winner = q_data.get("winner")
+                if winner not in winners:
+                    winner_txt = BRAND_DISPLAY.get(winner, "-") if winner else "-"
+                    winner_color = BRAND_COLORS.get(winner, "#333333") if winner else "#333333"
+                    winners[winner] = Paragraph(f'<font color="{winner_color}"><b>{winner_txt}</b></font>', small)
+        return {"queries": queries, "winners": winners}
+
+    def _search_term_table(self, data, engine, cells):
+        """Build per-query winner table for a specific engine from the shared _search_term_cells()."""
         qw = data["query_winners"]
-
-        header = [
-            Paragraph("<b>Query</b>", self.styles["SmallText"]),
-            Paragraph("<b>ON24</b>", self.styles["SmallText"]),
-            Paragraph("<b>Goldcast</b>", self.styles["SmallText"]),
-            Paragraph("<b>Zoom</b>", self.styles["SmallText"]),
-            Paragraph("<b>Winner</b>", self.styles["SmallText"]),
-        ]
-        rows = [header]
+        rows = [["Query", "ON24", "Goldcast", "Zoom", "Winner"]]
 
         for qid in sorted(qw.keys()):
             if engine not in qw[qid]:
                 continue
             q_data = qw[qid][engine]
-            q_text = queries.get(qid, {}).get("query_text", f"Query {qid}")
-            # Truncate
-            if len(q_text) > 55:
-                q_text = q_text[:52] + "..."
 
             brand_cells = []
             for brand in ["on24", "goldcast", "zoom"]:
@@ -541,117 +698,191 @@ class GEOReportGenerator:
                     sent = bd.get("sentiment")
                     sent_txt = f"{sent:.1f}" if sent is not None else ""
                     primary = " *" if bd.get("primary") else ""
-                    cell_txt = f"{pos_txt} | {sent_txt}{primary}"
-                    style = self.styles["SmallText"]
+                    brand_cells.append(f"{pos_txt} | {sent_txt}{primary}")
                 else:
-                    cell_txt = "-"
-                    style = self.styles["SmallText"]
-                brand_cells.append(Paragraph(cell_txt, style))
-
-            winner = q_data.get("winner")
-            winner_txt = BRAND_DISPLAY.get(winner, "-") if winner else "-"
-            winner_color = BRAND_COLORS.get(winner, "#333333") if winner else "#333333"
-            winner_cell = Paragraph(f'<font color="{winner_color}"><b>{winner_txt}</b></font>',
-                                    self.styles["SmallText"])
+                    brand_cells.append("-")
 
+            # Shallow copies: layout state is per-table, the parsed text is shared
             rows.append([
-                Paragraph(q_text, self.styles["SmallText"]),
+                copy.copy(cells["queries"][qid]),
                 *brand_cells,
-                winner_cell,
+                copy.copy(cells["winners"][q_data.get("winner")]),
             ])
 
         col_widths = [2.5 * inch, 1.0 * inch, 1.0 * inch, 1.0 * inch, 0.9 * inch]
         tbl = Table(rows, colWidths=col_widths, repeatRows=1)
-        tbl.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), ON24_DARK),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTSIZE", (0, 0), (-1, -1), 7),
-            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("GRID", (0, 0), (-1, -1), 0.5, MED_GRAY),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-        ]))
+        tbl.setStyle(SEARCH_TERM_TABLE_STYLE)
         return tbl
 
     def _category_table(self, data, engine):
         """Category performance summary table."""
-        header = [
-            Paragraph("<b>Category</b>", self.styles["SmallText"]),
-            Paragraph("<b>ON24 SOV</b>", self.styles["SmallText"]),
-            Paragraph("<b>Goldcast SOV</b>", self.styles["SmallText"]),
-            Paragraph("<b>Zoom SOV</b>", self.styles["SmallText"]),
-            Paragraph("<b>ON24 Wins</b>", self.styles["SmallText"]),
-        ]
-        rows = [header]
-
-        for cat in sorted(data["cat_data"].keys()):
-            eng_data = data["cat_data"][cat].get(engine, {})
-            on24 = eng_data.get("on24", {"sov": 0, "wins": 0, "total": 0})
-            gc = eng_data.get("goldcast", {"sov": 0, "wins": 0, "total": 0})
-            zm = eng_data.get("zoom", {"sov": 0, "wins": 0, "total": 0})
-
-            rows.append([
-                Paragraph(CATEGORY_DISPLAY.get(cat, cat), self.styles["SmallText"]),
-                Paragraph(f'{on24["sov"]:.0f}%', self.styles["SmallText"]),
-                Paragraph(f'{gc["sov"]:.0f}%', self.styles["SmallText"]),
-                Paragraph(f'{zm["sov"]:.0f}%', self.styles["SmallText"]),
-                Paragraph(f'{on24["wins"]}/{on24["total"]}', self.styles["SmallText"]),
-            ])
+        header = ["Category", "ON24 SOV", "Goldcast SOV", "Zoom SOV", "ON24 Wins"]
+        rows = [header] + data["cat_fmt"].get(engine, [])
 
         col_widths = [2.0 * inch, 1.2 * inch, 1.2 * inch, 1.2 * inch, 0.9 * inch]
         tbl = Table(rows, colWidths=col_widths, repeatRows=1)
-        tbl.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), ON24_DARK),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("GRID", (0, 0), (-1, -1), 0.5, MED_GRAY),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-            ("TOPPADDING", (0, 0), (-1, -1), 5),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ]))
+        tbl.setStyle(CATEGORY_TABLE_STYLE)
         return tbl
 
+    # ── Sections that need the recommendations ──────────────
+    def _executive_summary_section(self, data, recs):
+        """Section 1 flowables: the AI executive summary, primary-engine KPI cards and key wins/losses."""
+        story = []
+        story.append(Paragraph("1. Executive Summary", self.styles["SectionHeader"]))
+        story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
+
+        story.append(Paragraph(recs.get("executive_summary", ""), self.styles["BodyText"]))
+        story.append(Spacer(1, 0.15 * inch))
+
+        # KPI highlights for primary engine (grok preferred)
+        primary_engine = "grok_web_search" if "grok_web_search" in data["engines"] else data["engines"][0]
+        story.append(Paragraph(
+            f"<b>Key Metrics — {ENGINE_DISPLAY.get(primary_engine, primary_engine)}</b>",
+            self.styles["SubHeader"]
+        ))
+        story.append(self._kpi_cards(data, primary_engine))
+        story.append(Spacer(1, 0.2 * inch))
+
+        # Quick wins / losses bullets
+        if recs.get("wins"):
+            story.append(Paragraph("<b>Key Wins:</b>", self.styles["SubHeader"]))
+            for w in recs["wins"][:5]:
+                story.append(Paragraph(
+                    f'<b>{w.get("query", "")}</b> — {w.get("reason", "")}',
+                    self.styles["BulletItem"], bulletText=BULLET,
+                ))
+            story.append(Spacer(1, 0.1 * inch))
+
+        if recs.get("losses"):
+            story.append(Paragraph("<b>Key Losses:</b>", self.styles["SubHeader"]))
+            for l in recs["losses"][:5]:
+                comp = l.get("winning_competitor", "competitor")
+                story.append(Paragraph(
+                    f'<b>{l.get("query", "")}</b> — Lost to {comp}: {l.get("reason", "")}',
+                    self.styles["BulletItem"], bulletText=BULLET,
+                ))
+
+        story.append(PageBreak())
+        return story
+
+    def _recommendations_section(self, recs):
+        """Section 11 flowables: SOV assessment, prioritized recommendations and competitor insights."""
+        story = []
+        story.append(Paragraph("11. Recommendations", self.styles["SectionHeader"]))
+        story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
+
+        if recs.get("on24_sov_assessment"):
+            story.append(Paragraph(
+                f"<b>SOV Assessment:</b> {recs['on24_sov_assessment']}", self.styles["BodyText"]
+            ))
+            story.append(Spacer(1, 0.1 * inch))
+
+        if recs.get("recommendations"):
+            for i, rec in enumerate(recs["recommendations"], 1):
+                priority = rec.get("priority", i)
+                impact = rec.get("expected_impact", "medium").upper()
+                impact_color = LEVEL_COLORS.get(impact, "#333")
+                cat = rec.get("category", "")
+
+                story.append(Paragraph(
+                    f'<b>#{priority}. {rec.get("action", "")}</b> '
+                    f'<font color="{impact_color}" size="8">[{impact} IMPACT]</font> '
+                    f'<font color="#888" size="8">({cat})</font>',
+                    self.styles["BodyText"]
+                ))
+                story.append(Paragraph(
+                    f'<i>{rec.get("rationale", "")}</i>', self.styles["RecRationale"]
+                ))
+                story.append(Spacer(1, 0.05 * inch))
+
+        # Competitor insights
+        if recs.get("competitor_insights"):
+            story.append(Spacer(1, 0.15 * inch))
+            story.append(Paragraph("<b>Competitor Insights</b>", self.styles["SubHeader"]))
+            for comp in ["goldcast", "zoom"]:
+                ci = recs["competitor_insights"].get(comp, {})
+                if ci:
+                    threat = ci.get("threat_level", "medium").upper()
+                    threat_color = LEVEL_COLORS.get(threat, "#333")
+                    story.append(Paragraph(
+                        f'<b>{BRAND_DISPLAY.get(comp, comp)}</b> '
+                        f'<font color="{threat_color}" size="8">[{threat} THREAT]</font>',
+                        self.styles["BodyText"]
+                    ))
+                    if ci.get("strengths"):
+                        story.append(Paragraph(
+                            f'<b>Strengths:</b> {ci["strengths"]}',
+                            self.styles["BulletItem"], bulletText=BULLET,
+                        ))
+                    if ci.get("weaknesses"):
+                        story.append(Paragraph(
+                            f'<b>Weaknesses:</b> {ci["weaknesses"]}',
+                            self.styles["BulletItem"], bulletText=BULLET,
+                        ))
+                    story.append(Spacer(1, 0.05 * inch))
+
+        story.append(PageBreak())
+        return story
+
     # ── Header / Footer ──────────────────────────────────────
     @staticmethod
     def _header_footer(canvas, doc):
         canvas.saveState()
         # Header line
-        canvas.setStrokeColor(colors.HexColor("#0066CC"))
+        canvas.setStrokeColor(ON24_BLUE)
         canvas.setLineWidth(2)
         canvas.line(40, letter[1] - 35, letter[0] - 40, letter[1] - 35)
         canvas.setFont("Helvetica", 7)
-        canvas.setFillColor(colors.HexColor("#AAAAAA"))
+        canvas.setFillColor(FOOTER_GRAY)
         canvas.drawString(40, letter[1] - 30, "ON24 GEO Benchmark Report")
         canvas.drawRightString(letter[0] - 40, letter[1] - 30, "CONFIDENTIAL")
 
         # Footer
         canvas.setFont("Helvetica", 7)
-        canvas.setFillColor(colors.HexColor("#AAAAAA"))
-        canvas.drawString(40, 25, f"Generated {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+        canvas.setFillColor(FOOTER_GRAY)
+        canvas.drawString(40, 25, doc.generated_label)
         canvas.drawRightString(letter[0] - 40, 25, f"Page {doc.page}")
         canvas.restoreState()
 
     # ── Main report builder ───────────────────────────────────
-    def generate(self, run_id=None, output_path=None) -> str:
-        """Generate the full PDF report. Returns the output file path."""
-        data = self._load_data(run_id)
-
-        if output_path is None:
-            reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "output")
-            os.makedirs(reports_dir, exist_ok=True)
-            run_date = data["run"]["run_date"]
-            output_path = os.path.join(reports_dir, f"ON24_GEO_Report_{run_date}.pdf")
-
-        doc = SimpleDocTemplate(
-            output_path, pagesize=letter,
-            topMargin=0.6 * inch, bottomMargin=0.5 * inch,
-            leftMargin=0.6 * inch, rightMargin=0.6 * inch,
-        )
+    def generate(self, run_id=None, output_path=None, progress_cb=None, output_stream=None) -> str | None:
+        """Generate the full PDF report. Returns the output file path, or None when writing to output_stream.
+
+        Uses the artifacts from materialize() when they are current, otherwise computes everything here.
+        progress_cb, if given, is called with a short message as each stage starts.
+        output_stream, a writable binary file object (a response body, a pipe, a GzipFile), receives the
+        PDF instead of a file; nothing is added to the reports index and None is returned. reportlab
+        writes the document in one piece once layout finishes.
+        """
+        progress = progress_cb or (lambda message: None)
+        progress("Loading benchmark data")
+        artifacts = self._load_artifacts(run_id)
+        if artifacts:
+            data, recs = artifacts
+        else:
+            data, recs = self._load_data(run_id), None
+
+        # Start the chart workers now, so their startup overlaps the sections built before the
+        # charts, unless every matplotlib chart is already in the cache (a rebuilt report)
+        if not all(os.path.exists(_chart_cache_path(spec[0], spec[1]))
+                   for spec in self._matplotlib_chart_specs(data) if spec):
+            _chart_process_pool().submit(warm_up_chart_worker)
+
+        # The recommendations call is the slowest step; it runs while sections 2-10 are built
+        recs_future = None
+        if recs is None:
+            progress("Generating AI recommendations")
+            recs_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recs")
+            recs_future = recs_pool.submit(self._recommendations, data["run_id"])
+            recs_pool.shutdown(wait=False)
+
+        if output_path is None and output_stream is None:
+            os.makedirs(REPORTS_DIR, exist_ok=True)
+            output_path = report_path(data["run_id"], data["run"]["run_date"])
+
+        doc = _ReportDocTemplate(output_stream if output_stream is not None else output_path, self._header_footer)
+        # SubHeader is already bold, so per-engine headings need no inline markup
+        engine_titles = {e: ENGINE_DISPLAY.get(e, e) for e in data["engines"]}
 
         story = []
 
@@ -669,7 +900,7 @@ class GEOReportGenerator:
         cover_info = [
             ["Benchmark Run", f"#{data['run_id']}"],
             ["Queries Analyzed", str(data["run"]["total_queries"])],
-            ["LLM Engines", ", ".join(ENGINE_DISPLAY.get(e, e) for e in data["engines"])],
+            ["LLM Engines", ", ".join(engine_titles.values())],
             ["Brands Tracked", "ON24, Goldcast, Zoom (Webinars/Events)"],
         ]
         cover_tbl = Table(cover_info, colWidths=[2 * inch, 4 * inch])
@@ -710,62 +941,12 @@ class GEOReportGenerator:
             "12. Glossary",
         ]
         for item in toc_items:
-            story.append(Paragraph(item, ParagraphStyle(
-                "TOC", parent=self.styles["BodyText"],
-                fontSize=11, spaceBefore=4, spaceAfter=4, leftIndent=20,
-            )))
+            story.append(Paragraph(item, self.styles["TOCEntry"]))
         story.append(PageBreak())
 
         # ─── 1. EXECUTIVE SUMMARY ────────────────────────────
-        story.append(Paragraph("1. Executive Summary", self.styles["SectionHeader"]))
-        story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
-
-        # Generate recommendations to get executive summary
-        try:
-            rec_engine = RecommendationEngine(self.db)
-            recs = rec_engine.generate_recommendations(data["run_id"])
-        except Exception:
-            recs = {
-                "executive_summary": "Recommendations could not be generated.",
-                "wins": [], "losses": [], "recommendations": [],
-                "competitor_insights": {
-                    "goldcast": {"strengths": "N/A", "weaknesses": "N/A", "threat_level": "medium"},
-                    "zoom": {"strengths": "N/A", "weaknesses": "N/A", "threat_level": "medium"},
-                },
-            }
-
-        story.append(Paragraph(recs.get("executive_summary", ""), self.styles["BodyText"]))
-        story.append(Spacer(1, 0.15 * inch))
-
-        # KPI highlights for primary engine (grok preferred)
-        primary_engine = "grok_web_search" if "grok_web_search" in data["engines"] else data["engines"][0]
-        story.append(Paragraph(
-            f"<b>Key Metrics — {ENGINE_DISPLAY.get(primary_engine, primary_engine)}</b>",
-            self.styles["SubHeader"]
-        ))
-        story.append(self._kpi_cards(data, primary_engine))
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Quick wins / losses bullets
-        if recs.get("wins"):
-            story.append(Paragraph("<b>Key Wins:</b>", self.styles["SubHeader"]))
-            for w in recs["wins"][:5]:
-                story.append(Paragraph(
-                    f'<bullet>&bull;</bullet><b>{w.get("query", "")}</b> — {w.get("reason", "")}',
-                    self.styles["BulletItem"]
-                ))
-            story.append(Spacer(1, 0.1 * inch))
-
-        if recs.get("losses"):
-            story.append(Paragraph("<b>Key Losses:</b>", self.styles["SubHeader"]))
-            for l in recs["losses"][:5]:
-                comp = l.get("winning_competitor", "competitor")
-                story.append(Paragraph(
-                    f'<bullet>&bull;</bullet><b>{l.get("query", "")}</b> — Lost to {comp}: {l.get("reason", "")}',
-                    self.styles["BulletItem"]
-                ))
-
-        story.append(PageBreak())
+        # Inserted here once the recommendations are ready
+        summary_at = len(story)
 
         # ─── 2. METHODOLOGY ──────────────────────────────────
         story.append(Paragraph("2. Methodology", self.styles["SectionHeader"]))
@@ -795,8 +976,8 @@ class GEOReportGenerator:
         }
         for eng in data["engines"]:
             story.append(Paragraph(
-                f'<bullet>&bull;</bullet><b>{ENGINE_DISPLAY.get(eng, eng)}</b> — {engine_desc.get(eng, "")}',
-                self.styles["BulletItem"]
+                f'<b>{engine_titles[eng]}</b> — {engine_desc.get(eng, "")}',
+                self.styles["BulletItem"], bulletText=BULLET,
             ))
 
         story.append(Spacer(1, 0.1 * inch))
@@ -810,7 +991,7 @@ class GEOReportGenerator:
         ]
         for i, step in enumerate(pipeline_steps, 1):
             story.append(Paragraph(
-                f"<bullet>{i}.</bullet>{step}", self.styles["BulletItem"]
+                step, self.styles["BulletItem"], bulletText=f"{i}."
             ))
 
         story.append(PageBreak())
@@ -820,15 +1001,15 @@ class GEOReportGenerator:
         story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
 
         for engine in data["engines"]:
-            story.append(Paragraph(
-                f"<b>{ENGINE_DISPLAY.get(engine, engine)}</b>", self.styles["SubHeader"]
-            ))
+            story.append(Paragraph(engine_titles[engine], self.styles["SubHeader"]))
             story.append(self._kpi_cards(data, engine))
             story.append(Spacer(1, 0.2 * inch))
 
         story.append(PageBreak())
 
         # ─── 4. SHARE OF VOICE ───────────────────────────────
+        progress("Drawing charts and tables")
+        charts = self._render_charts(data)
         story.append(Paragraph("4. Share of Voice Analysis", self.styles["SectionHeader"]))
         story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
         story.append(Paragraph(
@@ -836,7 +1017,7 @@ class GEOReportGenerator:
             "in the LLM response. Higher SOV indicates stronger brand presence in AI search results.",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_sov_comparison(data))
+        story.append(charts["sov"])
         story.append(PageBreak())
 
         # ─── 5. WIN RATE ─────────────────────────────────────
@@ -848,7 +1029,7 @@ class GEOReportGenerator:
             "being mentioned first, and having the highest sentiment score.",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_win_rate(data))
+        story.append(charts["win_rate"])
         story.append(PageBreak())
 
         # ─── 6. MENTION POSITION ─────────────────────────────
@@ -859,7 +1040,7 @@ class GEOReportGenerator:
             "Position #1 means the brand is mentioned first — lower is better.",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_position(data))
+        story.append(charts["position"])
         story.append(PageBreak())
 
         # ─── 7. SENTIMENT ────────────────────────────────────
@@ -871,7 +1052,7 @@ class GEOReportGenerator:
             "Extracted by AI analyzing the context around each brand mention.",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_sentiment(data))
+        story.append(charts["sentiment"])
         story.append(PageBreak())
 
         # ─── 8. CITATION ANALYSIS ────────────────────────────
@@ -884,37 +1065,19 @@ class GEOReportGenerator:
             "<b>event.on24.com</b> (webinar event pages).",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_citations(data))
+        story.append(charts["citations"])
 
         # Citation summary table
         cs = data["citations"]
-        cite_rows = [
-            [Paragraph("<b>Domain</b>", self.styles["SmallText"]),
-             Paragraph("<b>Citations</b>", self.styles["SmallText"]),
-             Paragraph("<b>%</b>", self.styles["SmallText"])],
+        counts = np.array([cs[key] for key, _ in CITATION_BUCKETS], dtype=np.int64)
+        shares = np.char.mod("%.1f%%", counts * (100.0 / (data["total_citations"] or 1)))
+        cite_rows = [["Domain", "Citations", "%"]] + [
+            [label, str(count), share]
+            for (_, label), count, share in zip(CITATION_BUCKETS, counts.tolist(), shares.tolist())
         ]
-        total = data["total_citations"] or 1
-        for label, count in [("ON24 (www.on24.com)", cs["on24_www"]),
-                             ("ON24 (event.on24.com)", cs["on24_event"]),
-                             ("Goldcast", cs["goldcast"]),
-                             ("Zoom", cs["zoom"]),
-                             ("Other", cs["other"])]:
-            cite_rows.append([
-                Paragraph(label, self.styles["SmallText"]),
-                Paragraph(str(count), self.styles["SmallText"]),
-                Paragraph(f"{count/total*100:.1f}%", self.styles["SmallText"]),
-            ])
 
         cite_tbl = Table(cite_rows, colWidths=[3 * inch, 1.2 * inch, 1.2 * inch])
-        cite_tbl.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), ON24_DARK),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-            ("GRID", (0, 0), (-1, -1), 0.5, MED_GRAY),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ]))
+        cite_tbl.setStyle(REPORT_TABLE_STYLE)
         story.append(Spacer(1, 0.1 * inch))
         story.append(cite_tbl)
         story.append(PageBreak())
@@ -927,13 +1090,11 @@ class GEOReportGenerator:
             "different topic areas.",
             self.styles["BodyText"]
         ))
-        story.append(self._chart_category_heatmap(data))
+        story.append(charts["category"])
         story.append(Spacer(1, 0.2 * inch))
 
         for engine in data["engines"]:
-            story.append(Paragraph(
-                f"<b>{ENGINE_DISPLAY.get(engine, engine)}</b>", self.styles["SubHeader"]
-            ))
+            story.append(Paragraph(engine_titles[engine], self.styles["SubHeader"]))
             story.append(self._category_table(data, engine))
             story.append(Spacer(1, 0.15 * inch))
 
@@ -948,115 +1109,210 @@ class GEOReportGenerator:
             self.styles["BodyText"]
         ))
 
+        search_term_cells = self._search_term_cells(data)
         for engine in data["engines"]:
-            story.append(Paragraph(
-                f"<b>{ENGINE_DISPLAY.get(engine, engine)}</b>", self.styles["SubHeader"]
-            ))
-            story.append(self._search_term_table(data, engine))
+            story.append(Paragraph(engine_titles[engine], self.styles["SubHeader"]))
+            story.append(self._search_term_table(data, engine, search_term_cells))
             story.append(Spacer(1, 0.2 * inch))
 
         story.append(PageBreak())
 
         # ─── 11. RECOMMENDATIONS ─────────────────────────────
-        story.append(Paragraph("11. Recommendations", self.styles["SectionHeader"]))
-        story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
-
-        if recs.get("on24_sov_assessment"):
-            story.append(Paragraph(
-                f"<b>SOV Assessment:</b> {recs['on24_sov_assessment']}", self.styles["BodyText"]
-            ))
-            story.append(Spacer(1, 0.1 * inch))
-
-        if recs.get("recommendations"):
-            for i, rec in enumerate(recs["recommendations"], 1):
-                priority = rec.get("priority", i)
-                impact = rec.get("expected_impact", "medium").upper()
-                impact_color = {"HIGH": "#E74C3C", "MEDIUM": "#F39C12", "LOW": "#27AE60"}.get(impact, "#333")
-                cat = rec.get("category", "")
-
-                story.append(Paragraph(
-                    f'<b>#{priority}. {rec.get("action", "")}</b> '
-                    f'<font color="{impact_color}" size="8">[{impact} IMPACT]</font> '
-                    f'<font color="#888" size="8">({cat})</font>',
-                    self.styles["BodyText"]
-                ))
-                story.append(Paragraph(
-                    f'<i>{rec.get("rationale", "")}</i>',
-                    ParagraphStyle("RecRationale", parent=self.styles["BodyText"],
-                                   leftIndent=20, textColor=colors.HexColor("#555555"))
-                ))
-                story.append(Spacer(1, 0.05 * inch))
-
-        # Competitor insights
-        if recs.get("competitor_insights"):
-            story.append(Spacer(1, 0.15 * inch))
-            story.append(Paragraph("<b>Competitor Insights</b>", self.styles["SubHeader"]))
-            for comp in ["goldcast", "zoom"]:
-                ci = recs["competitor_insights"].get(comp, {})
-                if ci:
-                    threat = ci.get("threat_level", "medium").upper()
-                    threat_color = {"HIGH": "#E74C3C", "MEDIUM": "#F39C12", "LOW": "#27AE60"}.get(threat, "#333")
-                    story.append(Paragraph(
-                        f'<b>{BRAND_DISPLAY.get(comp, comp)}</b> '
-                        f'<font color="{threat_color}" size="8">[{threat} THREAT]</font>',
-                        self.styles["BodyText"]
-                    ))
-                    if ci.get("strengths"):
-                        story.append(Paragraph(
-                            f'<bullet>&bull;</bullet><b>Strengths:</b> {ci["strengths"]}',
-                            self.styles["BulletItem"]
-                        ))
-                    if ci.get("weaknesses"):
-                        story.append(Paragraph(
-                            f'<bullet>&bull;</bullet><b>Weaknesses:</b> {ci["weaknesses"]}',
-                            self.styles["BulletItem"]
-                        ))
-                    story.append(Spacer(1, 0.05 * inch))
-
-        story.append(PageBreak())
+        if recs_future is not None:
+            progress("Waiting for AI recommendations")
+            recs = recs_future.result()
+        story[summary_at:summary_at] = self._executive_summary_section(data, recs)
+        story += self._recommendations_section(recs)
 
         # ─── 12. GLOSSARY ────────────────────────────────────
         story.append(Paragraph("12. Glossary", self.styles["SectionHeader"]))
         story.append(HRFlowable(width="100%", thickness=1, color=ON24_BLUE, spaceAfter=10))
 
-        glossary = {
-            "GEO (Generative Engine Optimization)":
-                "The practice of optimizing a brand's content and online presence to appear favorably in "
-                "AI-generated search results. The AI equivalent of SEO.",
-            "Share of Voice (SOV)":
-                "The percentage of queries where a brand is mentioned at all in the LLM response. Higher is better.",
-            "Mention Position":
-                "The ordinal position where a brand first appears in an LLM response. Position #1 means "
-                "the brand is mentioned first. Lower is better.",
-            "Win Rate":
-                "The percentage of queries where a brand is determined to be the top recommendation, "
-                "based on primary recommendation status, mention position, and sentiment score.",
-            "Sentiment Score":
-                "A measure of how positively or negatively a brand is described. "
-                "Ranges from -1.0 (very negative) to +1.0 (very positive).",
-            "Primary Recommendation":
-                "When an LLM explicitly recommends one brand as the top/best choice for the query.",
-            "Citation":
-                "A URL referenced by an LLM in its response. Grok and ChatGPT include citations with web search.",
-            "Parametric Knowledge":
-                "What an LLM knows from its training data, without accessing the web.",
-            "Web Search (Live)":
-                "When an LLM searches the internet in real-time to answer a query.",
-        }
-
-        for term, defn in glossary.items():
-            story.append(Paragraph(f"<b>{term}</b>", self.styles["BodyText"]))
-            story.append(Paragraph(
-                defn, ParagraphStyle("GlossaryDef", parent=self.styles["BodyText"],
-                                     leftIndent=20, spaceBefore=0, spaceAfter=8,
-                                     textColor=colors.HexColor("#555555"))
-            ))
+        # Shallow copies: layout state is per-copy, the parsed text is shared
+        story += [copy.copy(f) for f in self._glossary_flowables()]
 
         # ─── Build PDF ───────────────────────────────────────
-        doc.build(story, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
+        progress("Laying out PDF")
+        doc.build(story)
+        if output_stream is not None:
+            return None
+        if os.path.dirname(os.path.abspath(output_path)) == os.path.abspath(REPORTS_DIR):
+            self.db.record_report(data["run_id"], output_path, os.path.getsize(output_path))
         return output_path
 
 
+@lru_cache(maxsize=1)
+def _chart_process_pool():
+    """Chart worker pool shared by every report; spawned rather than forked since the dashboard runs threads."""
+    return ProcessPoolExecutor(max_workers=CHART_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+
+
+@lru_cache(maxsize=1)
+def _svg2rlg():
+    """svglib's SVG -> Drawing converter, imported on first chart; None means charts fall back to PNG."""
+    try:
+        from svglib.svglib import svg2rlg
+    except ImportError:
+        return None
+    return svg2rlg
+
+
+@lru_cache(maxsize=8)
+def _cached_report_data(db_path, run_id, completed_at) -> dict:
+    """Aggregates behind every report section for one run, computed once per (run, completed_at)."""
+    import pandas as pd  # only needed here, so importing the module for its paths stays cheap
+
+    db = DatabaseManager(db_path)
+    run = db.get_run(run_id)
+    metrics = db.get_daily_metrics_for_run(run_id)
+    if not metrics:
+        raise ValueError(f"Benchmark run #{run_id} has no metrics.")
+    queries = {q["id"]: q for q in db.get_active_queries()}
+
+    brands = ["on24", "goldcast", "zoom"]
+
+    # One frame, grouped in C, instead of re-scanning the metric dicts per engine/brand
+    df = pd.DataFrame(metrics, columns=[
+        "llm_engine", "brand", "query_id", "query_category", "is_mentioned", "is_winner",
+        "first_mention_position", "avg_sentiment_score",
+    ])
+    engines = sorted(df["llm_engine"].unique())
+    tracked = df[df["brand"].isin(brands)].assign(
+        # Unranked (0/None) positions and missing sentiment drop out of the means as NaN
+        position=lambda d: pd.to_numeric(d["first_mention_position"], errors="coerce").where(lambda p: p > 0),
+        sentiment=lambda d: pd.to_numeric(d["avg_sentiment_score"], errors="coerce"),
+    )
+
+    # Per-(engine, brand) means from bincount over one integer key per row; matrix row = data["engines"] index
+    shape = (len(engines), len(brands))
+    # Engine and brand strings become int8 category codes once; everything below compares integers
+    engine_code = pd.Categorical(tracked["llm_engine"], categories=engines).codes
+    brand_code = pd.Categorical(tracked["brand"], categories=brands).codes
+    key = engine_code.astype(np.intp) * len(brands) + brand_code
+
+    def grouped_mean(values):
+        # NaN where an (engine, brand) pair has no non-NaN values
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        sums = np.bincount(key[valid], weights=values[valid], minlength=shape[0] * shape[1])
+        counts = np.bincount(key[valid], minlength=shape[0] * shape[1])
+        with np.errstate(invalid="ignore"):
+            return (sums / counts).reshape(shape)
+
+    present = np.bincount(key, minlength=shape[0] * shape[1]).reshape(shape) > 0
+    sov_mat = np.nan_to_num(grouped_mean(tracked["is_mentioned"])) * 100
+    pos_mat = grouped_mean(tracked["position"])  # NaN where the brand was never ranked
+    win_mat = np.nan_to_num(grouped_mean(tracked["is_winner"])) * 100
+    sent_mat = np.nan_to_num(grouped_mean(tracked["sentiment"]))
+
+    sov_by_engine = {e: {} for e in engines}
+    pos_by_engine = {e: {} for e in engines}
+    sent_by_engine = {e: {} for e in engines}
+    win_by_engine = {e: {} for e in engines}
+    for i, j in zip(*np.nonzero(present)):
+        engine, brand = engines[i], brands[j]
+        sov_by_engine[engine][brand] = float(sov_mat[i, j])
+        pos_by_engine[engine][brand] = None if np.isnan(pos_mat[i, j]) else float(pos_mat[i, j])
+        sent_by_engine[engine][brand] = float(sent_mat[i, j])
+        win_by_engine[engine][brand] = float(win_mat[i, j])
+
+    # Category breakdown: one pivot, rows = category, columns = (metric, agg, engine, brand).
+    # Pairs with no rows are NaN; cat_df is kept in the report data for ad-hoc export
+    cat_df = tracked.pivot_table(
+        index="query_category", columns=["llm_engine", "brand"], values=["is_mentioned", "is_winner"],
+        aggfunc={"is_mentioned": ["mean", "count"], "is_winner": "sum"},
+    )
+    sov_df, total_df, wins_df = (cat_df[col] for col in
+                                 [("is_mentioned", "mean"), ("is_mentioned", "count"), ("is_winner", "sum")])
+    cat_data = {}
+    for cat, engine in df[["query_category", "llm_engine"]].drop_duplicates().itertuples(index=False):
+        cat_data.setdefault(cat, {})[engine] = {}
+    for (engine, brand), totals in total_df.items():
+        for cat, total in totals.dropna().items():
+            cat_data[cat][engine][brand] = {"sov": float(sov_df.at[cat, (engine, brand)]) * 100,
+                                            "wins": int(wins_df.at[cat, (engine, brand)]), "total": int(total)}
+
+    # Category table rows per engine, already formatted; brands missing from a category read as 0
+    categories = sorted(cat_data)
+    columns = pd.MultiIndex.from_product([engines, brands])
+    sov_grid, total_grid, wins_grid = (frame.reindex(index=categories, columns=columns).fillna(0)
+                                       for frame in (sov_df, total_df, wins_df))
+    # One NumPy formatting pass over the (category, engine, brand) grid instead of an f-string per cell
+    sov_txt = np.char.mod("%.0f%%", sov_grid.to_numpy() * 100).reshape(len(categories), len(engines), len(brands))
+    wins_txt = np.char.add(np.char.add(wins_grid.to_numpy(dtype=np.int64).astype(str), "/"),
+                           total_grid.to_numpy(dtype=np.int64).astype(str)).reshape(sov_txt.shape)
+    labels = [CATEGORY_DISPLAY.get(c, c) for c in categories]
+    on24 = brands.index("on24")
+    cat_fmt = {
+        engine: [[label, *sov_txt[ci, ei].tolist(), str(wins_txt[ci, ei, on24])] for ci, label in enumerate(labels)]
+        for ei, engine in enumerate(engines)
+    }
+
+    # Winner per (query, engine) is an argmax over a (query, engine, brand) tensor, masked where nobody won
+    query_ids = np.sort(df["query_id"].unique())
+    won = np.zeros((len(query_ids), len(engines), len(brands)), dtype=bool)
+    won[np.searchsorted(query_ids, tracked["query_id"].to_numpy()), engine_code, brand_code] = (
+        tracked["is_winner"].fillna(0).to_numpy(dtype=bool))
+    winner_idx = won.argmax(axis=2)
+    has_winner = won.any(axis=2)
+    query_pos = {q: i for i, q in enumerate(query_ids)}
+    engine_pos = {e: i for i, e in enumerate(engines)}
+
+    # Per-query winners; rows are read back from metrics so cell values keep their SQLite types.
+    # Unordered: _search_term_table sorts the query ids it renders
+    query_winners = {}
+    for (qid, engine), idx in df.groupby(["query_id", "llm_engine"], sort=False).indices.items():
+        rows = [metrics[i] for i in idx]
+        qi, ei = query_pos[qid], engine_pos[engine]
+        query_winners.setdefault(qid, {})[engine] = {
+            "winner": brands[winner_idx[qi, ei]] if has_winner[qi, ei] else None,
+            "brands": {r["brand"]: {
+                "mentioned": r["is_mentioned"],
+                "position": r["first_mention_position"],
+                "sentiment": r["avg_sentiment_score"],
+                "primary": r["is_primary_recommendation"],
+            } for r in rows},
+        }
+
+    citation_summary = db.get_citation_summary(run_id)
+
+    return {
+        "run": run,
+        "run_id": run_id,
+        "metrics": metrics,
+        "queries": queries,
+        "engines": engines,
+        "brands": brands,
+        "sov": sov_by_engine,
+        "positions": pos_by_engine,
+        "sentiment": sent_by_engine,
+        "win_rate": win_by_engine,
+        "sov_mat": sov_mat,
+        "pos_mat": pos_mat,
+        "win_mat": win_mat,
+        "sent_mat": sent_mat,
+        "cat_data": cat_data,
+        "cat_df": cat_df,
+        "cat_fmt": cat_fmt,
+        "query_winners": query_winners,
+        "citations": citation_summary,
+        "total_citations": sum(citation_summary.values()),
+    }
+
+
+def materialize_in_background(run_id, db: DatabaseManager = None) -> threading.Thread:
+    """Precompute a finished run's report artifacts on a daemon thread so the caller isn't held up."""
+    def _work():
+        try:
+            GEOReportGenerator(db).materialize(run_id)
+        except Exception:
+            pass  # generate() falls back to computing from scratch
+
+    thread = threading.Thread(target=_work, daemon=True)
+    thread.start()
+    return thread
+
+
 def generate_report(run_id=None, output_path=None) -> str:
     """Convenience function to generate a PDF report."""
     gen = GEOReportGenerator()
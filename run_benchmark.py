@@ -29,6 +29,33 @@ def main():
         print(f"Benchmark failed: {e}")
         sys.exit(1)
 
+    # Build the run's report here so the Reports page only lists and downloads it; the scheduled
+    # job emails the newest PDF, so a missing report must fail the job rather than resend an old one
+    report_failed = False
+    try:
+        from reports.pdf_report import GEOReportGenerator
+
+        generator = GEOReportGenerator(engine.db)
+        generator.materialize(run_id)
+        path = generator.generate(run_id=run_id)
+        logging.info(f"Report generated: {path}")
+        print(f"Report generated: {path}")
+    except Exception as e:
+        logging.error(f"Report not generated: {e}", exc_info=True)
+        print(f"Report not generated: {e}")
+        report_failed = True
+
+    # Pick up PDFs added or deleted by hand since the last run
+    try:
+        from reports.pdf_report import REPORTS_DIR
+
+        engine.db.sync_reports_index(REPORTS_DIR)
+    except Exception as e:
+        logging.warning(f"Report index not synced: {e}", exc_info=True)
+
+    if report_failed:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()